@@ -12,13 +12,24 @@ Usage:
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import pandas as pd
 import time
-import random
 import json
 import os
-from datetime import datetime
+import re
+import csv
+import atexit
+import logging
+import threading
+from datetime import date, datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+# Per-date progress goes through logging; per-URL detail is at DEBUG level
+logger = logging.getLogger(__name__)
 
 
 # ============================================================================
@@ -29,32 +40,95 @@ BASE_URL = "https://example-news-site.com"
 MEDIA_NAME = "EXAMPLE NEWS"
 CACHE_DIR = "cache_example"
 
+# Parallelization Configuration
+MAX_WORKERS = 8  # Number of concurrent threads fetching archive pages
+REQUESTS_PER_SECOND = 2  # Politeness limit shared by all worker threads
+
+# Regex an absolute article URL must match to be kept (e.g. r"/article/")
+ARTICLE_LINK_PATTERN = r"YOUR_FILTER_PATTERN_HERE"  # CUSTOMIZE THIS
+
 # Additional site-specific constants (if needed)
 # For example, TOI uses INITIAL_STARTTIME
 # Add any constants specific to your news source here
 
 
+# Compiled once: hrefs worth following (site-relative or http/https) and article URLs
+LINK_RE = re.compile(r"^(?:/|https?://)")
+ARTICLE_LINK_RE = re.compile(ARTICLE_LINK_PATTERN)
+
+
 # ============================================================================
 # CACHE MANAGEMENT (REUSABLE - NO CHANGES NEEDED)
 # ============================================================================
 
 PROGRESS_FILE = os.path.join(CACHE_DIR, "scraping_progress.json")
+PROGRESS_BITS_FILE = os.path.join(CACHE_DIR, "completed_dates.bin")
 DATA_CACHE_FILE = os.path.join(CACHE_DIR, "scraped_data_cache.csv")
+PROGRESS_SAVE_EVERY = 20  # Dates between progress-file rewrites
+# Bit 0 of the completed-dates bitset. Saved bitsets are laid out from this
+# date, so it cannot move; dates before it cannot be tracked
+PROGRESS_EPOCH = date(1990, 1, 1)
+
+
+def date_index(day):
+    """Bit index of a date in the completed-dates bitset."""
+    if day < PROGRESS_EPOCH:
+        raise ValueError(
+            f"{day} is before PROGRESS_EPOCH ({PROGRESS_EPOCH}); "
+            "progress tracking cannot record it"
+        )
+    return (day - PROGRESS_EPOCH).days
+
+
+def is_completed(completed, idx):
+    """Check whether the date at bit index idx is marked as scraped."""
+    if idx < 0:
+        return False
+    byte = idx >> 3
+    return byte < len(completed) and bool(completed[byte] & (1 << (idx & 7)))
+
+
+def mark_completed(completed, idx):
+    """Mark the date at bit index idx as scraped, growing the bitset if needed."""
+    if idx < 0:
+        # A negative index would wrap around and mark an unrelated date
+        raise ValueError(f"Bit index {idx} is before PROGRESS_EPOCH")
+    byte = idx >> 3
+    if byte >= len(completed):
+        completed.extend(bytes(byte - len(completed) + 1))
+    completed[byte] |= 1 << (idx & 7)
 
 
 def load_progress():
-    """Load scraping progress from cache."""
+    """Load scraping progress from cache.
+
+    Completed dates are kept as a bytearray bitset (one bit per day since
+    PROGRESS_EPOCH); older progress files with a JSON date list are converted.
+    """
+    progress = {"completed": bytearray(), "last_date": None}
     if os.path.exists(PROGRESS_FILE):
         with open(PROGRESS_FILE, "r") as f:
-            return json.load(f)
-    return {"completed_dates": [], "last_date": None}
-
-
-def save_progress(completed_dates, last_date):
+            saved = json.load(f)
+        progress["last_date"] = saved.get("last_date")
+        for date_str in saved.get("completed_dates", []):
+            day = datetime.strptime(date_str, "%Y-%m-%d").date()
+            mark_completed(progress["completed"], date_index(day))
+    if os.path.exists(PROGRESS_BITS_FILE):
+        with open(PROGRESS_BITS_FILE, "rb") as f:
+            bits = f.read()
+        completed = progress["completed"]
+        completed.extend(bytes(max(0, len(bits) - len(completed))))
+        for i, b in enumerate(bits):
+            completed[i] |= b
+    return progress
+
+
+def save_progress(completed, last_date):
     """Save scraping progress to cache."""
     os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(PROGRESS_BITS_FILE, "wb") as f:
+        f.write(completed)
     progress = {
-        "completed_dates": completed_dates,
         "last_date": last_date,
         "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
     }
@@ -62,15 +136,39 @@ def save_progress(completed_dates, last_date):
         json.dump(progress, f, indent=2)
 
 
+_writer = None
+_writer_fh = None
+
+
+def _get_writer(fieldnames):
+    """Open the cache CSV once in append mode and reuse its writer."""
+    global _writer, _writer_fh
+    if _writer is None:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        is_new = not os.path.exists(DATA_CACHE_FILE)
+        _writer_fh = open(DATA_CACHE_FILE, "a", newline="", encoding="utf-8")
+        _writer = csv.DictWriter(_writer_fh, fieldnames=list(fieldnames))
+        if is_new:
+            _writer.writeheader()
+    return _writer
+
+
+def _close_writer():
+    """Close the cache CSV handle (registered with atexit)."""
+    if _writer_fh is not None:
+        _writer_fh.close()
+
+
+atexit.register(_close_writer)
+
+
 def append_to_cache(articles):
     """Append articles to cache CSV file."""
-    os.makedirs(CACHE_DIR, exist_ok=True)
-    df = pd.DataFrame(articles)
-
-    if os.path.exists(DATA_CACHE_FILE):
-        df.to_csv(DATA_CACHE_FILE, mode="a", header=False, index=False)
-    else:
-        df.to_csv(DATA_CACHE_FILE, mode="w", header=True, index=False)
+    if not articles:
+        return
+    writer = _get_writer(articles[0].keys())
+    writer.writerows(articles)
+    _writer_fh.flush()
 
 
 def load_cached_data():
@@ -80,6 +178,48 @@ def load_cached_data():
     return pd.DataFrame()
 
 
+def load_seen_links():
+    """Load the set of article links already present in the cache CSV."""
+    if os.path.exists(DATA_CACHE_FILE):
+        return set(pd.read_csv(DATA_CACHE_FILE, usecols=["Article Link"])["Article Link"])
+    return set()
+
+
+class RateLimiter:
+    """Token-bucket limiter shared by worker threads (one token per request)."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self.next_slot = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until the calling thread may issue its next request."""
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        time.sleep(max(0.0, slot - now))
+
+
+rate_limiter = RateLimiter(REQUESTS_PER_SECOND)
+
+# Shared keep-alive session; transient errors are retried with backoff by urllib3
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    ),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+
 # ============================================================================
 # SITE-SPECIFIC SCRAPING LOGIC - CUSTOMIZE THIS SECTION
 # ============================================================================
@@ -116,7 +256,7 @@ def scrape_articles_for_date(year, month, day):
     # Hindu: (implement based on their archive structure)
 
     url = f"{BASE_URL}/archive/{year}/{month:02d}/{day:02d}/"  # CUSTOMIZE THIS
-    print(f"Scraping URL: {url}")
+    logger.debug("Scraping URL: %s", url)
 
     # ========================================================================
     # STEP 2: Set up headers
@@ -130,15 +270,19 @@ def scrape_articles_for_date(year, month, day):
     }
 
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = SESSION.get(url, headers=headers, timeout=30)
 
         if response.status_code != 200:
-            print(
-                f"Failed to retrieve data from {url} - Status code: {response.status_code}"
+            logger.warning(
+                "Failed to retrieve data from %s - Status code: %s",
+                url,
+                response.status_code,
             )
             return []
 
-        soup = BeautifulSoup(response.content, "html.parser")
+        # Only anchors are needed here, so let lxml skip building every other node
+        strainer = SoupStrainer("a", href=True)
+        soup = BeautifulSoup(response.content, "lxml", parse_only=strainer)
 
         # ====================================================================
         # STEP 3: Extract article links - CUSTOMIZE THIS SECTION
@@ -147,6 +291,7 @@ def scrape_articles_for_date(year, month, day):
         # Different websites have different HTML structures and patterns
 
         article_links = []
+        seen_links = set()
 
         # Example 1: Indian Express approach (look for /article/ in href)
         # for link in soup.find_all('a', href=True):
@@ -154,8 +299,10 @@ def scrape_articles_for_date(year, month, day):
         #     if '/article/' in href:
         #         full_link = BASE_URL + href if href.startswith('/') else href
         #         full_link = full_link.split('?')[0]  # Remove query params
-        #         if full_link not in [item['Article Link'] for item in article_links]:
-        #             article_links.append({...})
+        #         if full_link in seen_links:
+        #             continue
+        #         seen_links.add(full_link)
+        #         article_links.append({...})
 
         # Example 2: Times of India approach (filter by keywords)
         # for link in soup.find_all('a', href=True):
@@ -163,38 +310,40 @@ def scrape_articles_for_date(year, month, day):
         #     if href.startswith('/') or href.startswith('http'):
         #         full_link = BASE_URL + href if href.startswith('/') else href
         #         if "articles" in full_link or "news" in full_link:
-        #             if full_link not in [item['Article Link'] for item in article_links]:
-        #                 article_links.append({...})
+        #             if full_link in seen_links:
+        #                 continue
+        #             seen_links.add(full_link)
+        #             article_links.append({...})
 
         # YOUR IMPLEMENTATION HERE:
-        for link in soup.find_all("a", href=True):
+        # The soup only holds <a href> tags (see SoupStrainer above)
+        for link in soup:
             href = link["href"]
 
-            # Implement your site-specific filtering logic
-            # Example placeholder logic:
-            if href.startswith("/"):
-                full_link = BASE_URL + href
-            elif href.startswith("http"):
-                full_link = href
-            else:
+            # Skip mailto:, javascript:, fragments, etc.
+            if not LINK_RE.match(href):
+                continue
+            full_link = BASE_URL + href if href[0] == "/" else href
+
+            # Site-specific filtering via ARTICLE_LINK_PATTERN (see configuration)
+            if not ARTICLE_LINK_RE.search(full_link):
                 continue
+            if full_link in seen_links:
+                continue
+            seen_links.add(full_link)
+            article_links.append(
+                {
+                    "Media Name": MEDIA_NAME,
+                    "Article Link": full_link,
+                    "Date": date_str,
+                }
+            )
 
-            # Add your filtering conditions (e.g., URL patterns, keywords, etc.)
-            if "YOUR_FILTER_CONDITION_HERE":  # CUSTOMIZE THIS
-                if full_link not in [item["Article Link"] for item in article_links]:
-                    article_links.append(
-                        {
-                            "Media Name": MEDIA_NAME,
-                            "Article Link": full_link,
-                            "Date": date_str,
-                        }
-                    )
-
-        print(f"Found {len(article_links)} articles for {date_str}")
+        logger.info("Found %d articles for %s", len(article_links), date_str)
         return article_links
 
     except Exception as e:
-        print(f"Error scraping {url}: {str(e)}")
+        logger.warning("Error scraping %s: %s", url, e)
         return []
 
 
@@ -203,53 +352,81 @@ def scrape_articles_for_date(year, month, day):
 # ============================================================================
 
 
-def scrape_articles(start_year=2020, end_year=2024, use_cache=True):
+def _scrape_date(date):
+    """Wait for a rate-limiter slot, then scrape a single date."""
+    rate_limiter.acquire()
+    return scrape_articles_for_date(date.year, date.month, date.day)
+
+
+def scrape_articles(
+    start_year=2020,
+    end_year=2024,
+    use_cache=True,
+    max_workers=MAX_WORKERS,
+    seen_links=None,
+):
     """
     Scrape articles for a date range with caching support.
 
-    This function is reusable across all scrapers.
+    This function is reusable across all scrapers. Dates are fetched
+    concurrently; results are consumed on the calling thread, so the cache
+    and progress state need no extra locking.
 
     Args:
         start_year (int): Starting year
         end_year (int): Ending year (inclusive)
         use_cache (bool): Whether to use cache and resume from last position
+        max_workers (int): Number of concurrent threads fetching archive pages
+        seen_links (set): Article links already cached; loaded from the cache
+            when not given and updated in place as new articles are kept
 
     Returns:
-        list: List of all articles scraped
+        list: List of all new (previously unseen) articles scraped
     """
     progress = (
-        load_progress() if use_cache else {"completed_dates": [], "last_date": None}
+        load_progress() if use_cache else {"completed": bytearray(), "last_date": None}
     )
-    completed_dates = set(progress["completed_dates"])
+    completed = progress["completed"]
 
-    print(f"\nCache status: {len(completed_dates)} dates already scraped")
+    num_completed = int.from_bytes(completed, "little").bit_count()
+    logger.info("Cache status: %d dates already scraped", num_completed)
     if progress["last_date"]:
-        print(f"Last scraped date: {progress['last_date']}")
+        logger.info("Last scraped date: %s", progress["last_date"])
+
+    if seen_links is None:
+        seen_links = load_seen_links() if use_cache else set()
 
     all_articles = []
+    last_date = progress["last_date"]
+    dirty = 0
 
-    for year in range(start_year, end_year + 1):
-        for month in range(1, 13):
-            # Calculate days in month
-            if month in [1, 3, 5, 7, 8, 10, 12]:
-                num_days = 31
-            elif month in [4, 6, 9, 11]:
-                num_days = 30
-            else:  # February
-                num_days = (
-                    29 if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0) else 28
-                )
-
-            for day in range(1, num_days + 1):
-                date_str = f"{year}-{month:02d}-{day:02d}"
-
-                # Skip if already scraped
-                if use_cache and date_str in completed_dates:
-                    print(f"Skipping {date_str} (already scraped)")
-                    continue
+    dates = pd.date_range(f"{start_year}-01-01", f"{end_year}-12-31")
+
+    pending = []
+    for d in dates:
+        # Skip if already scraped
+        if use_cache and is_completed(completed, date_index(d.date())):
+            logger.debug("Skipping %s (already scraped)", d.date())
+            continue
+        pending.append(d)
 
+    logger.info("Scraping %d dates with %d threads", len(pending), max_workers)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_date = {executor.submit(_scrape_date, d): d for d in pending}
+
+            for future in as_completed(future_to_date):
+                d = future_to_date[future]
+                date_str = d.strftime("%Y-%m-%d")
                 try:
-                    articles = scrape_articles_for_date(year, month, day)
+                    # Drop links already cached or found on another date
+                    articles = [
+                        a
+                        for a in future.result()
+                        if a["Article Link"] not in seen_links
+                    ]
+                    seen_links.update(a["Article Link"] for a in articles)
                     if articles:
                         all_articles.extend(articles)
 
@@ -257,17 +434,22 @@ def scrape_articles(start_year=2020, end_year=2024, use_cache=True):
                         if use_cache:
                             append_to_cache(articles)
 
-                    # Mark date as completed
+                    # Mark date as completed; progress is flushed every
+                    # PROGRESS_SAVE_EVERY dates rather than on each one
                     if use_cache:
-                        completed_dates.add(date_str)
-                        save_progress(list(completed_dates), date_str)
+                        mark_completed(completed, date_index(d.date()))
+                        last_date = date_str
+                        dirty += 1
+                        if dirty >= PROGRESS_SAVE_EVERY:
+                            save_progress(completed, last_date)
+                            dirty = 0
 
                 except Exception as e:
-                    print(f"Error on {date_str}: {e}")
+                    logger.warning("Error on %s: %s", date_str, e)
                     continue
-
-                # Random delay between requests
-                time.sleep(random.uniform(1, 3))
+    finally:
+        if use_cache and dirty:
+            save_progress(completed, last_date)
 
     return all_articles
 
@@ -290,21 +472,22 @@ def main():
     print(f"\nScraping articles from {START_YEAR} to {END_YEAR}")
     print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
 
-    # Check for existing cache
-    cached_df = load_cached_data()
-    if len(cached_df) > 0:
-        print(f"\nFound cached data: {len(cached_df)} articles")
+    # Check for existing cache (only the link column is needed up front)
+    seen_links = load_seen_links()
+    if seen_links:
+        print(f"\nFound cached data: {len(seen_links)} articles")
         print("Resuming from last position...\n")
 
-    # Scrape articles
-    all_data = scrape_articles(start_year=START_YEAR, end_year=END_YEAR, use_cache=True)
+    # Scrape articles; only unseen links are returned and appended to the cache
+    scrape_articles(
+        start_year=START_YEAR,
+        end_year=END_YEAR,
+        use_cache=True,
+        seen_links=seen_links,
+    )
 
-    # Combine with cached data
-    if len(cached_df) > 0:
-        new_df = pd.DataFrame(all_data)
-        df = pd.concat([cached_df, new_df], ignore_index=True)
-    else:
-        df = pd.DataFrame(all_data)
+    # The cache CSV now holds every unique article, old and new
+    df = load_cached_data()
 
     # Display results
     print("\n" + "=" * 80)
@@ -317,9 +500,6 @@ def main():
         print("\nFirst 5 articles:")
         print(df.head())
 
-        # Remove duplicates
-        df = df.drop_duplicates(subset=["Article Link"], keep="first")
-
         # Save final output
         output_file = f'{MEDIA_NAME.lower().replace(" ", "_")}_articles_{START_YEAR}_to_{END_YEAR}.csv'
         df.to_csv(output_file, index=False)
@@ -335,4 +515,5 @@ def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
     main()
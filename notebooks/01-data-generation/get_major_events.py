@@ -1,180 +1,241 @@
+import asyncio
+import aiohttp
 import pandas as pd
 import holidays
-import requests
-import time
-from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
+import logging
+import orjson
+import re
+import shelve
+from cachetools import LRUCache
+from functools import lru_cache
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Per-request and per-event details are logged at DEBUG; set level=logging.DEBUG to see them
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
 
 # Define year range
 start_year = 1995
 end_year = 2025
 
-# Initialize list to collect dates info
-data = []
+# Collect output column-wise; the DataFrame is built once after the loop.
+# Date and Day are filled in from the vectorized date range afterwards.
+columns = {
+    'Date': [], 'Day': [], 'Is_Holiday': [], 'Holiday_Name': [], 'Holiday_Category': [],
+    'Events_Count': [], 'Event_Good_Count': [], 'Event_Bad_Count': [], 'Event_Sentiment': [],
+    'Event_Texts': [], 'Event_Links': []
+}
 # Get India holidays (default is observed holidays)
 india_holidays = holidays.India(years=range(start_year, end_year + 1))
 
-session = requests.Session()
 headers = {"User-Agent": "bias-detection-events-script/1.0"}
-cache = {}
-cache_lock = Lock()
+request_timeout = aiohttp.ClientTimeout(total=20)
+# Bounded month-day -> events cache; values are tuples so cached events are never mutated in place.
+# Everything runs on one thread/event loop, so no lock is needed.
+cache = LRUCache(maxsize=512)
+# On-disk (etag, last_modified, payload) store keyed by "MM-DD" so reruns can revalidate with a 304
+http_cache = shelve.open("wm_otd_cache.db")
+
+logging.info("Starting run: %d-01-01 to %d-12-31", start_year, end_year)
+logging.info("Initializing cache and HTTP session")
+
+hindu_kw = [
+    'diwali','deepavali','holi','pongal','navratri','dussehra','vijaya dashami','dashami',
+    'ram navami','ramnavami','krishna janmashtami','janmashtami','ganesh','makar sankranti','sankranti',
+    'ugadi','gudi padwa','onam','thaipusam','mahashivratri','maha shivratri','raksha bandhan','bhaidooj','bhai dooj',
+    'vishu','akshaya tritiya','karva chauth','lohri'
+]
+muslim_kw = [
+    'eid','ramadan','ramzan','bakrid','eid al-adha','eid al fitr','eid-ul-fitr','eid-ul-adha',
+    'muharram','milad','mawlid','id-e-milad','shab-e-barat'
+]
+christian_kw = [
+    'christmas','good friday','easter','palm sunday','ash wednesday','holy saturday','boxing day'
+]
+sikh_kw = [
+    'guru nanak','gurpurab','baisakhi','vaisakhi','guru gobind singh','guru tegh bahadur','guru arjan'
+]
+general_kw = [
+    'republic day','independence day','gandhi jayanti','labour day','may day','new year','teachers day','children',
+    'ambedkar jayanti','maharashtra day','bihu','vesak','buddha purnima','onam','chhath'
+]
+bad_kw = [
+    'war','bomb','attack','terror','killed','dead','died','massacre','disaster','earthquake','flood','tsunami',
+    'hurricane','pandemic','outbreak','assassinated','assassination','murder','riot','riots','violence','explosion',
+    'crash','shooting','genocide','famine','collapse','defeat','invasion','conflict','hostage','kidnapping'
+]
+good_kw = [
+    'peace','treaty','agreement','ceasefire','launch','founded','discovered','won','victory','award','nobel',
+    'opens','opening','inaugurated','independence','liberation','rescue','recovered','record','milestone','landed',
+    'success','first','achieved','approved','breakthrough'
+]
+
+def build_matcher(keywords):
+    # Match every keyword in one pass: an Aho-Corasick automaton if available, else one regex alternation
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for kw in keywords:
+            automaton.add_word(kw, kw)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+    pattern = re.compile('|'.join(map(re.escape, keywords)))
+    return lambda text: pattern.search(text) is not None
 
-print(f"Starting run: {start_year}-01-01 to {end_year}-12-31", flush=True)
-print("Initializing cache and HTTP session", flush=True)
+# Checked in order; the first category with a keyword hit wins
+holiday_matchers = [
+    ('hindu', build_matcher(hindu_kw)),
+    ('muslim', build_matcher(muslim_kw)),
+    ('christian', build_matcher(christian_kw)),
+    ('sikh', build_matcher(sikh_kw)),
+    ('general', build_matcher(general_kw)),
+]
+event_matchers = [
+    ('bad', build_matcher(bad_kw)),
+    ('good', build_matcher(good_kw)),
+]
 
+# Holiday names and many event texts repeat across years, so memoize the classifiers
+@lru_cache(maxsize=1024)
 def classify_holiday(name: str) -> str:
     if not name:
         return ''
     n = name.lower()
-    hindu_kw = [
-        'diwali','deepavali','holi','pongal','navratri','dussehra','vijaya dashami','dashami',
-        'ram navami','ramnavami','krishna janmashtami','janmashtami','ganesh','makar sankranti','sankranti',
-        'ugadi','gudi padwa','onam','thaipusam','mahashivratri','maha shivratri','raksha bandhan','bhaidooj','bhai dooj',
-        'vishu','akshaya tritiya','karva chauth','lohri'
-    ]
-    muslim_kw = [
-        'eid','ramadan','ramzan','bakrid','eid al-adha','eid al fitr','eid-ul-fitr','eid-ul-adha',
-        'muharram','milad','mawlid','id-e-milad','shab-e-barat'
-    ]
-    christian_kw = [
-        'christmas','good friday','easter','palm sunday','ash wednesday','holy saturday','boxing day'
-    ]
-    sikh_kw = [
-        'guru nanak','gurpurab','baisakhi','vaisakhi','guru gobind singh','guru tegh bahadur','guru arjan'
-    ]
-    if any(k in n for k in hindu_kw):
-        return 'hindu'
-    if any(k in n for k in muslim_kw):
-        return 'muslim'
-    if any(k in n for k in christian_kw):
-        return 'christian'
-    if any(k in n for k in sikh_kw):
-        return 'sikh'
-    general_kw = [
-        'republic day','independence day','gandhi jayanti','labour day','may day','new year','teachers day','children',
-        'ambedkar jayanti','maharashtra day','bihu','vesak','buddha purnima','onam','chhath'
-    ]
-    if any(k in n for k in general_kw):
-        return 'general'
+    for category, matches in holiday_matchers:
+        if matches(n):
+            return category
     return 'general'
 
 
+@lru_cache(maxsize=8192)
 def classify_event_text(text: str) -> str:
     if not text:
         return ''
     t = text.lower()
-    bad_kw = [
-        'war','bomb','attack','terror','killed','dead','died','massacre','disaster','earthquake','flood','tsunami',
-        'hurricane','pandemic','outbreak','assassinated','assassination','murder','riot','riots','violence','explosion',
-        'crash','shooting','genocide','famine','collapse','defeat','invasion','conflict','hostage','kidnapping'
-    ]
-    good_kw = [
-        'peace','treaty','agreement','ceasefire','launch','founded','discovered','won','victory','award','nobel',
-        'opens','opening','inaugurated','independence','liberation','rescue','recovered','record','milestone','landed',
-        'success','first','achieved','approved','breakthrough'
-    ]
-    if any(k in t for k in bad_kw):
-        return 'bad'
-    if any(k in t for k in good_kw):
-        return 'good'
+    for sentiment, matches in event_matchers:
+        if matches(t):
+            return sentiment
     return 'neutral'
 
-def fetch_month_day(mm: int, dd: int):
+async def fetch_month_day(session, sem, mm: int, dd: int):
     key = (mm, dd)
-    with cache_lock:
-        if key in cache:
-            print(f"Cache hit for {mm:02d}-{dd:02d}", flush=True)
-            return cache[key]
+    if key in cache:
+        logging.debug("Cache hit for %02d-%02d", mm, dd)
+        return cache[key]
     url = f"https://api.wikimedia.org/feed/v1/wikipedia/en/onthisday/all/{mm:02d}/{dd:02d}"
+    http_key = f"{mm:02d}-{dd:02d}"
+    entry = http_cache.get(http_key)
+    req_headers = {}
+    if entry:
+        if entry.get("etag"):
+            req_headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            req_headers["If-Modified-Since"] = entry["last_modified"]
     attempts = 0
     while attempts < 5:
         try:
-            print(f"Fetching events for {mm:02d}-{dd:02d}, attempt {attempts+1}", flush=True)
-            resp = session.get(url, headers=headers, timeout=20)
-            if resp.status_code == 429:
+            logging.debug("Fetching events for %02d-%02d, attempt %d", mm, dd, attempts + 1)
+            async with sem, session.get(url, headers=req_headers, timeout=request_timeout) as resp:
+                status = resp.status
+                if status == 304:
+                    logging.debug("Not modified (304) for %02d-%02d, reusing stored payload", mm, dd)
+                    payload = entry["payload"]
+                elif status != 429:
+                    resp.raise_for_status()
+                    payload = orjson.loads(await resp.read())
+                    http_cache[http_key] = {
+                        "etag": resp.headers.get("ETag"),
+                        "last_modified": resp.headers.get("Last-Modified"),
+                        "payload": payload,
+                    }
+            if status == 429:
                 sleep_s = 2 ** attempts
-                print(f"Rate limited (429) for {mm:02d}-{dd:02d}, sleeping {sleep_s}s", flush=True)
-                time.sleep(sleep_s)
+                logging.warning("Rate limited (429) for %02d-%02d, sleeping %ds", mm, dd, sleep_s)
+                await asyncio.sleep(sleep_s)
                 attempts += 1
                 continue
-            resp.raise_for_status()
-            payload = resp.json()
             events_primary = payload.get("events", []) or []
             events_selected = payload.get("selected", []) or []
-            # Merge selected into events to avoid missing curated items (e.g., multi-day attacks)
-            events = events_primary + [e for e in events_selected if e not in events_primary]
-            print(f"Received {len(events)} total items for {mm:02d}-{dd:02d} (events={len(events_primary)}, selected={len(events_selected)})", flush=True)
-            with cache_lock:
-                cache[key] = events
-            time.sleep(0.05)
-            return events
+            # Merge selected into events to avoid missing curated items (e.g., multi-day attacks);
+            # (year, text) identifies an event without comparing whole nested dicts
+            seen = {(e.get("year"), e.get("text")) for e in events_primary}
+            events = events_primary + [e for e in events_selected if (e.get("year"), e.get("text")) not in seen]
+            logging.debug("Received %d total items for %02d-%02d (events=%d, selected=%d)", len(events), mm, dd, len(events_primary), len(events_selected))
+            await asyncio.sleep(0.05)
+            return tuple(events)
         except Exception as e:
             sleep_s = 2 ** attempts
-            print(f"Error fetching {mm:02d}-{dd:02d} on attempt {attempts+1}: {e}. Sleeping {sleep_s}s", flush=True)
-            time.sleep(sleep_s)
+            logging.warning("Error fetching %02d-%02d on attempt %d: %s. Sleeping %ds", mm, dd, attempts + 1, e, sleep_s)
+            await asyncio.sleep(sleep_s)
             attempts += 1
-    print(f"Giving up on {mm:02d}-{dd:02d} after {attempts} attempts", flush=True)
-    with cache_lock:
-        cache[key] = []
-    return []
+    logging.error("Giving up on %02d-%02d after %d attempts", mm, dd, attempts)
+    return ()
 
-def prefetch_events(all_dates, batch_size: int = 10, max_workers: int = 10):
-    print(f"Prefetching events by month-day with batch_size={batch_size}, max_workers={max_workers}", flush=True)
+async def fetch_month_days(pairs, max_concurrency: int = 20):
+    # One pooled session for every request; the semaphore keeps us polite towards the API
+    connector = aiohttp.TCPConnector(limit=max_concurrency, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+        sem = asyncio.Semaphore(max_concurrency)
+        results = await asyncio.gather(*[fetch_month_day(session, sem, mm, dd) for mm, dd in pairs])
+    return dict(zip(pairs, results))
+
+def prefetch_events(all_dates, max_concurrency: int = 20):
+    logging.info("Prefetching events by month-day with max_concurrency=%d", max_concurrency)
     unique_md = sorted({(d.month, d.day) for d in all_dates})
-    print(f"Unique month-day pairs to fetch: {len(unique_md)}", flush=True)
-    for i in range(0, len(unique_md), batch_size):
-        batch = unique_md[i:i+batch_size]
-        print(f"Fetching batch {i//batch_size + 1}: {[f'{mm:02d}-{dd:02d}' for mm, dd in batch]}", flush=True)
-        with ThreadPoolExecutor(max_workers=min(max_workers, len(batch))) as executor:
-            futures = {executor.submit(fetch_month_day, mm, dd): (mm, dd) for mm, dd in batch}
-            for fut in as_completed(futures):
-                mm, dd = futures[fut]
-                try:
-                    events = fut.result()
-                    print(f"Completed {mm:02d}-{dd:02d} with {len(events)} events", flush=True)
-                except Exception as e:
-                    print(f"Batch fetch error for {mm:02d}-{dd:02d}: {e}", flush=True)
-        time.sleep(0.2)
+    logging.info("Unique month-day pairs to fetch: %d", len(unique_md))
+    cache.update(asyncio.run(fetch_month_days(unique_md, max_concurrency)))
+    logging.info("Prefetched events for %d month-day pairs", len(cache))
 
 all_dates = pd.date_range(start=f"{start_year}-01-01", end=f"{end_year}-12-31")
 
-# Prefetch in parallel batches of 10
-prefetch_events(all_dates, batch_size=20, max_workers=10)
+# Prefetch all month-day pairs concurrently
+prefetch_events(all_dates, max_concurrency=20)
+
+# Per-date calendar attributes, computed once for the whole range
+date_objs = all_dates.date
+years = all_dates.year.tolist()
+months = all_dates.month.tolist()
+days = all_dates.day.tolist()
+month_labels = all_dates.strftime('%Y-%m').tolist()
 
 prev_month = None
 processed = 0
-for date in all_dates:
-    if prev_month != date.month:
-        print(f"Processing month {date.strftime('%Y-%m')}...", flush=True)
-        prev_month = date.month
+# Month-days already re-fetched from the main loop; each is retried at most once
+retried = set()
+for day_date, yyyy, mm, dd, month_label in zip(date_objs, years, months, days, month_labels):
+    if prev_month != mm:
+        logging.info("Processing month %s...", month_label)
+        prev_month = mm
     processed += 1
     if processed % 100 == 0:
-        print(f"Processed {processed} dates so far (up to {date.date()})", flush=True)
+        logging.debug("Processed %d dates so far (up to %s)", processed, day_date)
 
-    day_name = date.day_name()
-    holiday_name = india_holidays.get(date.date())
+    holiday_name = india_holidays.get(day_date)
     is_holiday = bool(holiday_name)
-    mm = date.month
-    dd = date.day
-    yyyy = date.year
 
     # Read from cache (should already be populated by prefetch). If empty, retry once.
-    with cache_lock:
-        month_day_events = list(cache.get((mm, dd), []))
-    if not month_day_events:
-        print(f"Cache empty for {mm:02d}-{dd:02d}, retrying fetch once from main loop", flush=True)
-        month_day_events = fetch_month_day(mm, dd)
+    month_day_events = cache.get((mm, dd), ())
+    if not month_day_events and (mm, dd) not in retried:
+        retried.add((mm, dd))
+        logging.warning("Cache empty for %02d-%02d, retrying fetch once from main loop", mm, dd)
+        cache.pop((mm, dd), None)
+        month_day_events = asyncio.run(fetch_month_days([(mm, dd)]))[(mm, dd)]
+        cache[(mm, dd)] = month_day_events
 
     todays_events = []
     links = []
-    sentiments = []
+    good_count = 0
+    bad_count = 0
     for ev in month_day_events:
         try:
             if int(ev.get("year", 0)) == yyyy:
                 text = ev.get("text") or ""
                 todays_events.append(text)
-                sentiments.append(classify_event_text(text))
+                sentiment = classify_event_text(text)
+                good_count += sentiment == 'good'
+                bad_count += sentiment == 'bad'
                 pages = ev.get("pages") or []
                 if pages:
                     page = pages[0]
@@ -184,32 +245,34 @@ for date in all_dates:
                     if url:
                         links.append(url)
         except Exception as e:
-            print(f"Error parsing event for {date.date()}: {e}", flush=True)
+            logging.warning("Error parsing event for %s: %s", day_date, e)
 
     holiday_category = classify_holiday(holiday_name if holiday_name else '')
-    good_count = sum(1 for s in sentiments if s == 'good')
-    bad_count = sum(1 for s in sentiments if s == 'bad')
     overall_sent = 'bad' if bad_count > 0 else ('good' if good_count > 0 else 'neutral')
 
-    data.append({
-        'Date': date.date(),
-        'Day': day_name,
-        'Is_Holiday': is_holiday,
-        'Holiday_Name': holiday_name if holiday_name else '',
-        'Holiday_Category': holiday_category,
-        'Events_Count': len(todays_events),
-        'Event_Good_Count': good_count,
-        'Event_Bad_Count': bad_count,
-        'Event_Sentiment': overall_sent,
-        'Event_Texts': ' || '.join(todays_events),
-        'Event_Links': ' || '.join(links)
-    })
-
-# Create DataFrame
-df = pd.DataFrame(data)
-print(f"Created DataFrame with {len(df)} rows", flush=True)
+    columns['Is_Holiday'].append(is_holiday)
+    columns['Holiday_Name'].append(holiday_name if holiday_name else '')
+    columns['Holiday_Category'].append(holiday_category)
+    columns['Events_Count'].append(len(todays_events))
+    columns['Event_Good_Count'].append(good_count)
+    columns['Event_Bad_Count'].append(bad_count)
+    columns['Event_Sentiment'].append(overall_sent)
+    columns['Event_Texts'].append(' || '.join(todays_events))
+    columns['Event_Links'].append(' || '.join(links))
+
+http_cache.close()
+
+# Create DataFrame; low-cardinality string columns are stored as categoricals
+columns['Date'] = date_objs
+df = pd.DataFrame({
+    **columns,
+    'Day': pd.Categorical(all_dates.day_name()),
+    'Holiday_Category': pd.Categorical(columns['Holiday_Category']),
+    'Event_Sentiment': pd.Categorical(columns['Event_Sentiment']),
+})
+logging.info("Created DataFrame with %d rows", len(df))
 
 # Save to CSV
 csv_filename = f"india_calendar_events_{start_year}_{end_year}.csv"
 df.to_csv(csv_filename, index=False)
-print(f"Calendar with holidays and events saved to {csv_filename}", flush=True)
\ No newline at end of file
+logging.info("Calendar with holidays and events saved to %s", csv_filename)
\ No newline at end of file
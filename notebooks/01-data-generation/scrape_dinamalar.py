@@ -4,19 +4,24 @@ Dinamalar Archive Article Scraper
 This script scrapes article URLs from Dinamalar archive pages.
 Archive URL format: https://www.dinamalar.com/archive/YYYY-Mon/DD
 Example: https://www.dinamalar.com/archive/2025-Jan/02
+
+Network I/O runs on asyncio + aiohttp; HTML parsing stays synchronous.
 """
 
-import requests
+import asyncio
+import functools
+import itertools
+import aiohttp
 from bs4 import BeautifulSoup
-import time
-import random
-import json
+from lxml import html as lhtml
+import soupsieve
+import orjson
 import os
 import re
+import time
 from datetime import datetime, timedelta
-from pymongo import MongoClient
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import threading
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import BulkWriteError
 
 # Base URL for Dinamalar
 BASE_URL = "https://www.dinamalar.com"
@@ -24,14 +29,63 @@ BASE_URL = "https://www.dinamalar.com"
 # Progress tracking
 CACHE_DIR = "cache_dinamalar"
 PROGRESS_FILE = os.path.join(CACHE_DIR, "scraping_progress.json")
+PROGRESS_SAVE_EVERY = 20  # Dates between progress-file rewrites
 
 # MongoDB Configuration
 MONGO_URI = "mongodb://localhost:27017/"
 MONGO_DB = "test"
 MONGO_COLLECTION = "articles"
 
-# Parallelization Configuration
-MAX_WORKERS = 5
+# Concurrency Configuration
+MAX_WORKERS = 20  # Maximum article requests in flight at once
+REQUESTS_PER_SECOND = 3  # Polite crawl rate across all requests
+
+# HTTP Configuration
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+RETRY_STATUSES = {500, 502, 503, 504}
+MAX_RETRIES = 3
+MAX_CONTENT_LENGTH = 2_000_000  # Larger pages are media, not articles
+
+# Request headers shared by every request on the HTTP session
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5,ta;q=0.3",
+    "Connection": "keep-alive",
+}
+
+# Article body containers, most specific first
+BODY_SELECTORS = (
+    "div.article-content",
+    "div.story-content",
+    "div.news-content",
+    "div.video-content",
+    "article",
+    "div[class*=content i], div[class*=article i], div[class*=story i]",
+    "div[id*=content i], div[id*=article i], div[id*=story i]",
+)
+# Compiled once: all body candidates in one walk, plus a matcher per tier
+BODY_SELECTOR = soupsieve.compile(", ".join(BODY_SELECTORS))
+BODY_SELECTOR_TIERS = tuple(soupsieve.compile(selector) for selector in BODY_SELECTORS)
+
+# Compiled once: ad/social blocks to strip from the article body
+AD_CLASS_RE = re.compile(r"ad|advertisement|promo|social|share|related|comment", re.I)
+
+# Article URLs: /news/{category}/{slug}/{id}; category pages lack the trailing id
+ARTICLE_URL_RE = re.compile(r"/news/[^/]+/[^/]+/\d+")
+TRAILING_ID_RE = re.compile(r"/\d+$")
+
+# Boilerplate phrases (Tamil and English) that mark non-article text
+SKIP_PHRASES = (
+    "advertisement",
+    "also read",
+    "read more",
+    "subscribe",
+    "follow us",
+    "download app",
+    "மேலும் படிக்க",  # Tamil: Read more
+    "இதையும் படிக்கவும்",  # Tamil: Also read this
+)
 
 # Month name mapping for URL construction
 MONTH_NAMES = {
@@ -50,9 +104,21 @@ MONTH_NAMES = {
 }
 
 
+@functools.lru_cache(maxsize=1)
 def get_mongo_collection():
-    """Get MongoDB collection instance."""
-    client = MongoClient(MONGO_URI)
+    """
+    Get the MongoDB collection instance.
+
+    Cached so the process shares one client (and connection pool), and the
+    URL index is ensured only on first use.
+    """
+    client = MongoClient(
+        MONGO_URI,
+        maxPoolSize=MAX_WORKERS * 2,
+        minPoolSize=1,
+        retryWrites=True,
+        w=1,
+    )
     db = client[MONGO_DB]
     collection = db[MONGO_COLLECTION]
     # Create index on URL to speed up duplicate checks
@@ -60,6 +126,59 @@ def get_mongo_collection():
     return collection
 
 
+class RateLimiter:
+    """Token-bucket limiter shared by all coroutines (one token per request)."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self.next_slot = time.monotonic()
+
+    async def acquire(self):
+        """Wait until the caller may issue its next request."""
+        # Slot bookkeeping runs without an await, so no lock is needed
+        now = time.monotonic()
+        slot = max(now, self.next_slot)
+        self.next_slot = slot + self.interval
+        await asyncio.sleep(slot - now)
+
+
+rate_limiter = RateLimiter(REQUESTS_PER_SECOND)
+
+
+async def fetch_html(session, url, check_content=False, **kwargs):
+    """
+    GET a URL, retrying 5xx responses with exponential backoff.
+
+    Args:
+        session (aiohttp.ClientSession): Shared HTTP session
+        url (str): URL to fetch
+        check_content (bool): Reject 200 responses that are not HTML or are
+            larger than MAX_CONTENT_LENGTH
+        **kwargs: Extra arguments for session.get (e.g. headers)
+
+    Returns:
+        tuple: (HTTP status code, response body bytes)
+
+    Raises:
+        ValueError: If check_content is set and a 200 response is not HTML
+            or is too large; the body is not downloaded in that case
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        await rate_limiter.acquire()
+        async with session.get(url, timeout=REQUEST_TIMEOUT, **kwargs) as response:
+            if response.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                if check_content and response.status == 200:
+                    content_type = response.headers.get("Content-Type", "").lower()
+                    if content_type and "html" not in content_type:
+                        raise ValueError(f"Unsupported content type: {content_type}")
+                    if (response.content_length or 0) > MAX_CONTENT_LENGTH:
+                        raise ValueError(
+                            f"Response too large: {response.content_length} bytes"
+                        )
+                return response.status, await response.read()
+        await asyncio.sleep(0.3 * 2**attempt)
+
+
 def build_archive_url(date):
     """
     Build archive URL for a specific date.
@@ -74,30 +193,98 @@ def build_archive_url(date):
     return f"{BASE_URL}/archive/{date.year}-{month_name}/{date.day:02d}"
 
 
-def extract_article_content(url):
+async def extract_article_content(session, url):
     """
-    Extract the full content of an article from Dinamalar.
+    Fetch an article from Dinamalar and extract its content.
 
     Args:
+        session (aiohttp.ClientSession): Shared HTTP session
         url (str): Article URL
 
     Returns:
         dict: Dictionary containing article content and metadata
     """
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.5,ta;q=0.3",
-        "Connection": "keep-alive",
-    }
-
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        status, html = await fetch_html(session, url, check_content=True)
+    except asyncio.TimeoutError:
+        return {"success": False, "url": url, "error": "Timeout"}
+    except (aiohttp.ClientError, ValueError) as e:
+        return {"success": False, "url": url, "error": str(e)}
+
+    if status != 200:
+        return {"success": False, "error": f"HTTP {status}"}
+
+    return parse_article_content(url, html)
 
-        if response.status_code != 200:
-            return {"success": False, "error": f"HTTP {response.status_code}"}
 
-        soup = BeautifulSoup(response.content, "html.parser")
+def find_article_body(soup):
+    """
+    Find the article body container, trying BODY_SELECTORS in priority order.
+
+    All candidates are collected in a single walk of the tree; the first match
+    of each selector is then tried in order, skipping empty containers.
+
+    Args:
+        soup (BeautifulSoup): Parsed article page
+
+    Returns:
+        Tag or None: The body container, if any selector matched
+    """
+    first_match = {}
+    for element in BODY_SELECTOR.select(soup):
+        for rank, tier in enumerate(BODY_SELECTOR_TIERS):
+            if rank not in first_match and tier.match(element):
+                first_match[rank] = element
+
+    article_body = None
+    for rank in range(len(BODY_SELECTORS)):
+        article_body = first_match.get(rank)
+        if article_body:
+            break
+    return article_body
+
+
+def parse_json_ld(soup):
+    """
+    Parse the JSON-LD blocks of a page, skipping empty or invalid ones.
+
+    Args:
+        soup (BeautifulSoup): Parsed article page
+
+    Returns:
+        list: JSON-LD objects (dicts), in page order
+    """
+    objects = []
+    for json_ld in soup.find_all("script", type="application/ld+json"):
+        if not json_ld.string:
+            continue
+        try:
+            # orjson only accepts exact str, not bs4's str subclasses
+            data = orjson.loads(str(json_ld.string))
+        except orjson.JSONDecodeError:
+            continue
+        if isinstance(data, list):
+            data = data[0] if data else None
+        if isinstance(data, dict):
+            objects.append(data)
+    return objects
+
+
+def parse_article_content(url, html):
+    """
+    Extract the full content of an article from Dinamalar.
+
+    Args:
+        url (str): Article URL
+        html (bytes): Raw article HTML
+
+    Returns:
+        dict: Dictionary containing article content and metadata
+    """
+    try:
+        soup = BeautifulSoup(html, "lxml")
+        # Bound once; soup.find is called many times below
+        find = soup.find
 
         # Initialize result dictionary
         article_data = {
@@ -115,11 +302,11 @@ def extract_article_content(url):
         }
 
         # Extract title from h1 tag or og:title
-        title_tag = soup.find("h1")
+        title_tag = find("h1")
         if title_tag:
             article_data["title"] = title_tag.get_text(strip=True)
         else:
-            og_title = soup.find("meta", property="og:title")
+            og_title = find("meta", property="og:title")
             if og_title:
                 article_data["title"] = og_title.get("content")
 
@@ -127,12 +314,12 @@ def extract_article_content(url):
         article_data["author"] = "Dinamalar"
 
         # Extract published date from meta tags
-        date_meta = soup.find("meta", property="article:published_time")
+        date_meta = find("meta", property="article:published_time")
         if date_meta:
             article_data["published_date"] = date_meta.get("content")
         else:
             # Try to find date in page content
-            time_tag = soup.find("time")
+            time_tag = find("time")
             if time_tag:
                 article_data["published_date"] = time_tag.get(
                     "datetime"
@@ -140,21 +327,24 @@ def extract_article_content(url):
 
         # If still no published date, try to infer from 'ADDED :' label in page text
         if not article_data["published_date"]:
-            page_text = soup.get_text("\n", strip=True)
-            for raw_line in page_text.split("\n"):
-                line = raw_line.strip()
+            # Scan text nodes lazily and stop at the first match
+            for line in (
+                raw_line.strip()
+                for text in soup.stripped_strings
+                for raw_line in text.splitlines()
+            ):
                 if line.upper().startswith("ADDED :"):
                     # Store the date/time portion after 'ADDED :'
                     article_data["published_date"] = line.replace("ADDED :", "").strip()
                     break
 
         # Try modified date
-        modified_meta = soup.find("meta", property="article:modified_time")
+        modified_meta = find("meta", property="article:modified_time")
         if modified_meta:
             article_data["modified_date"] = modified_meta.get("content")
 
         # Extract section/category from URL or breadcrumb
-        section_meta = soup.find("meta", property="article:section")
+        section_meta = find("meta", property="article:section")
         if section_meta:
             article_data["section"] = section_meta.get("content")
         else:
@@ -167,42 +357,48 @@ def extract_article_content(url):
                 )
 
         # Extract tags/keywords
-        keywords_meta = soup.find("meta", attrs={"name": "keywords"})
+        keywords_meta = find("meta", attrs={"name": "keywords"})
         if keywords_meta:
             article_data["tags"] = keywords_meta.get("content")
         else:
-            tag_meta = soup.find("meta", property="article:tag")
+            tag_meta = find("meta", property="article:tag")
             if tag_meta:
                 article_data["tags"] = tag_meta.get("content")
 
+        def _fill_metadata_from_json_ld(data):
+            if not article_data["title"] and "headline" in data:
+                article_data["title"] = data["headline"]
+            if not article_data["published_date"] and "datePublished" in data:
+                article_data["published_date"] = data["datePublished"]
+            if not article_data["modified_date"] and "dateModified" in data:
+                article_data["modified_date"] = data["dateModified"]
+
+        # A substantial JSON-LD articleBody is the cleanest source of the text;
+        # when present it skips the whole container/paragraph cascade below
+        json_ld_objects = parse_json_ld(soup)
+        for data in json_ld_objects:
+            body = data.get("articleBody")
+            if isinstance(body, str) and len(body.split()) >= 40:
+                article_data["article_text"] = body
+                article_data["word_count"] = len(body.split())
+                _fill_metadata_from_json_ld(data)
+                return article_data
+
         # Extract article text/body
         article_text_parts = []
+        append_part = article_text_parts.append
 
         # Try to find article body - Dinamalar uses various containers
-        article_body = None
-
-        # Try different selectors
-        for selector in [
-            ("div", {"class": "article-content"}),
-            ("div", {"class": "story-content"}),
-            ("div", {"class": "news-content"}),
-            ("div", {"class": "video-content"}),
-            ("article", {}),
-            ("div", {"class": re.compile(r"content|article|story", re.I)}),
-            ("div", {"id": re.compile(r"content|article|story", re.I)}),
-        ]:
-            article_body = soup.find(selector[0], selector[1])
-            if article_body:
-                break
+        article_body = find_article_body(soup)
 
         # As a last resort, fall back to <main> or the whole <body>
         if article_body is None:
-            main_tag = soup.find("main")
+            main_tag = find("main")
             article_body = main_tag if main_tag is not None else soup.body
 
         if article_body:
             # Remove unwanted elements
-            for element in article_body.find_all(
+            unwanted = article_body.find_all(
                 [
                     "script",
                     "style",
@@ -213,25 +409,13 @@ def extract_article_content(url):
                     "iframe",
                     "noscript",
                 ]
-            ):
+            )
+            for element in unwanted:
                 element.decompose()
 
             # Remove ads and social elements
-            for element in article_body.find_all(
-                class_=lambda x: x
-                and any(
-                    keyword in str(x).lower()
-                    for keyword in [
-                        "ad",
-                        "advertisement",
-                        "promo",
-                        "social",
-                        "share",
-                        "related",
-                        "comment",
-                    ]
-                )
-            ):
+            ads = article_body.find_all(class_=AD_CLASS_RE)
+            for element in ads:
                 element.decompose()
 
             # First try standard paragraph tags
@@ -240,71 +424,43 @@ def extract_article_content(url):
                 text = p.get_text(strip=True)
                 if len(text) > 15:
                     # Skip unwanted phrases (Tamil and English)
-                    if not any(
-                        skip_word in text.lower()
-                        for skip_word in [
-                            "advertisement",
-                            "also read",
-                            "read more",
-                            "subscribe",
-                            "follow us",
-                            "download app",
-                            "மேலும் படிக்க",  # Tamil: Read more
-                            "இதையும் படிக்கவும்",  # Tamil: Also read this
-                        ]
-                    ):
-                        article_text_parts.append(text)
-
-            def _add_lines_from_text(raw_text):
-                for raw_line in raw_text.split("\n"):
-                    line = raw_line.strip()
-                    if not line:
-                        continue
-                    # Skip lines that are just the title or metadata
-                    if article_data["title"] and line == article_data["title"]:
-                        continue
-                    if line.upper().startswith("ADDED :"):
-                        continue
-                    if "our apps available on" in line.lower():
-                        continue
-                    if any(
-                        skip_word in line.lower()
-                        for skip_word in [
-                            "advertisement",
-                            "also read",
-                            "read more",
-                            "subscribe",
-                            "follow us",
-                            "download app",
-                            "மேலும் படிக்க",
-                            "இதையும் படிக்கவும்",
-                        ]
-                    ):
-                        continue
-                    if len(line.split()) < 3:
-                        continue
-                    article_text_parts.append(line)
+                    lowered = text.lower()
+                    if not any(phrase in lowered for phrase in SKIP_PHRASES):
+                        append_part(text)
+
+            def _add_lines_from_text(text_chunks):
+                title = article_data["title"]
+                # Chunks may hold several lines (e.g. multi-line text nodes)
+                for chunk in text_chunks:
+                    for raw_line in chunk.splitlines():
+                        line = raw_line.strip()
+                        if not line:
+                            continue
+                        # Skip lines that are just the title or metadata
+                        if title and line == title:
+                            continue
+                        if line.upper().startswith("ADDED :"):
+                            continue
+                        lowered = line.lower()
+                        if "our apps available on" in lowered:
+                            continue
+                        if any(phrase in lowered for phrase in SKIP_PHRASES):
+                            continue
+                        if len(line.split()) < 3:
+                            continue
+                        append_part(line)
 
             # If paragraphs are missing or too short, fall back to line-based extraction
             if not article_text_parts or len(" ".join(article_text_parts).split()) < 40:
-                # 1) From the detected article_body container
-                full_text = article_body.get_text("\n", strip=True)
-                _add_lines_from_text(full_text)
+                # 1) From the detected article_body container, node by node
+                _add_lines_from_text(article_body.stripped_strings)
 
                 # 2) If still short, use the page text around the 'ADDED :' marker
                 if len(" ".join(article_text_parts).split()) < 40:
-                    page_text = soup.get_text("\n", strip=True)
-                    segment = page_text
-                    if "ADDED :" in segment:
-                        segment = segment.split("ADDED :", 1)[1]
-                    # Cut off trailing app/promo section if present
-                    marker = "Our Apps Available On"
-                    if marker in segment:
-                        segment = segment.split(marker, 1)[0]
-                    _add_lines_from_text(segment)
+                    _add_lines_from_text(_iter_page_segment(soup))
 
         # Also try to get description/summary from og:description as an extra hint
-        og_desc = soup.find("meta", property="og:description")
+        og_desc = find("meta", property="og:description")
         if og_desc:
             desc_text = og_desc.get("content")
             if (
@@ -324,84 +480,89 @@ def extract_article_content(url):
             for p in all_paragraphs:
                 text = p.get_text(strip=True)
                 if len(text) > 50:  # Higher threshold for fallback
-                    article_text_parts.append(text)
+                    append_part(text)
 
         article_data["article_text"] = "\n\n".join(article_text_parts)
         article_data["word_count"] = len(article_data["article_text"].split())
 
         # If still no content, try JSON-LD data (only when article_text is empty)
         if not article_data["article_text"]:
-            json_ld_scripts = soup.find_all("script", type="application/ld+json")
-            for json_ld in json_ld_scripts:
-                try:
-                    data = json.loads(json_ld.string)
-                    if isinstance(data, list):
-                        data = data[0]
-                    if isinstance(data, dict):
-                        if "articleBody" in data:
-                            article_data["article_text"] = data["articleBody"]
-                            article_data["word_count"] = len(
-                                article_data["article_text"].split()
-                            )
-
-                        if not article_data["title"] and "headline" in data:
-                            article_data["title"] = data["headline"]
-                        if (
-                            not article_data["published_date"]
-                            and "datePublished" in data
-                        ):
-                            article_data["published_date"] = data["datePublished"]
-                        if not article_data["modified_date"] and "dateModified" in data:
-                            article_data["modified_date"] = data["dateModified"]
-
-                        if article_data["article_text"]:
-                            break
-                except (json.JSONDecodeError, TypeError):
-                    pass
+            for data in json_ld_objects:
+                if "articleBody" in data:
+                    article_data["article_text"] = data["articleBody"]
+                    article_data["word_count"] = len(
+                        article_data["article_text"].split()
+                    )
+                _fill_metadata_from_json_ld(data)
+                if article_data["article_text"]:
+                    break
 
         return article_data
 
-    except requests.exceptions.Timeout:
-        return {"success": False, "url": url, "error": "Timeout"}
-    except requests.exceptions.RequestException as e:
-        return {"success": False, "url": url, "error": str(e)}
     except Exception as e:
         return {"success": False, "url": url, "error": str(e)}
 
 
-def scrape_dinamalar_articles_for_date(date):
+def _iter_page_segment(soup):
+    """
+    Yield the page's text nodes after the first 'ADDED :' marker (or the whole
+    page if there is none), stopping at the trailing app/promo section.
+
+    Args:
+        soup (BeautifulSoup): Parsed article page
+
+    Yields:
+        str: Stripped text nodes (the boundary nodes are cut at the markers)
+    """
+    strings = soup.stripped_strings
+    before_marker = []
+    for text in strings:
+        if "ADDED :" in text:
+            strings = itertools.chain((text.split("ADDED :", 1)[1],), strings)
+            break
+        before_marker.append(text)
+    else:
+        strings = before_marker
+
+    # Cut off trailing app/promo section if present
+    marker = "Our Apps Available On"
+    for text in strings:
+        if marker in text:
+            yield text.split(marker, 1)[0]
+            return
+        yield text
+
+
+async def scrape_dinamalar_articles_for_date(session, date):
     """
     Scrape article links from Dinamalar archive for a specific date.
 
     Args:
+        session (aiohttp.ClientSession): Shared HTTP session
         date (datetime): Date to scrape
 
     Returns:
-        list: List of dictionaries containing article information
+        list: List of dictionaries containing article information, or None
+            if the archive page could not be fetched
     """
     archive_url = build_archive_url(date)
     print(f"Scraping archive: {archive_url}")
 
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.5,ta;q=0.3",
-        "Referer": BASE_URL,
-        "Connection": "keep-alive",
-    }
-
     try:
-        response = requests.get(archive_url, headers=headers, timeout=30)
+        status, html = await fetch_html(
+            session, archive_url, headers={"Referer": BASE_URL}
+        )
 
-        if response.status_code == 404:
+        if status == 404:
             print(f"Archive not found for {date.strftime('%Y-%m-%d')}")
             return []
 
-        if response.status_code != 200:
-            print(f"Failed to retrieve archive - Status code: {response.status_code}")
-            return []
+        if status != 200:
+            print(f"Failed to retrieve archive - Status code: {status}")
+            return None
 
-        soup = BeautifulSoup(response.content, "html.parser")
+        # Only anchors matter, so walk lxml's link iterator instead of a soup
+        links = lhtml.fromstring(html).iterlinks() if html.strip() else ()
 
         article_links = []
         seen_urls = set()
@@ -410,8 +571,9 @@ def scrape_dinamalar_articles_for_date(date):
         # Dinamalar news article URLs follow pattern:
         # - /news/{category}/{slug}/{id}
 
-        for link in soup.find_all("a", href=True):
-            href = link["href"]
+        for element, attribute, href, _ in links:
+            if attribute != "href" or element.tag != "a":
+                continue
 
             # Make full URL if relative
             if href.startswith("/"):
@@ -430,12 +592,12 @@ def scrape_dinamalar_articles_for_date(date):
                 continue
             if full_link.endswith("/"):
                 # Check if it's a category page (no article ID)
-                if not re.search(r"/\d+$", full_link.rstrip("/")):
+                if not TRAILING_ID_RE.search(full_link.rstrip("/")):
                     continue
 
             # Match article URL patterns with numeric ID at end
             # Pattern: /news/.../{id} (news section only)
-            if re.search(r"/news/[^/]+/[^/]+/\d+", full_link):
+            if ARTICLE_URL_RE.search(full_link):
                 if full_link not in seen_urls:
                     seen_urls.add(full_link)
                     article_links.append(
@@ -451,27 +613,29 @@ def scrape_dinamalar_articles_for_date(date):
 
     except Exception as e:
         print(f"Error scraping archive for {date.strftime('%Y-%m-%d')}: {str(e)}")
-        return []
+        return None
 
 
 def load_progress():
     """Load scraping progress from cache."""
     if os.path.exists(PROGRESS_FILE):
-        with open(PROGRESS_FILE, "r") as f:
-            return json.load(f)
+        with open(PROGRESS_FILE, "rb") as f:
+            return orjson.loads(f.read())
     return {"completed_dates": [], "total_articles": 0}
 
 
 def save_progress(completed_dates, total_articles):
-    """Save scraping progress to cache."""
+    """Save scraping progress to cache (atomically, via a temp file)."""
     os.makedirs(CACHE_DIR, exist_ok=True)
     progress = {
         "completed_dates": completed_dates,
         "total_articles": total_articles,
         "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
     }
-    with open(PROGRESS_FILE, "w") as f:
-        json.dump(progress, f, indent=2)
+    tmp_file = PROGRESS_FILE + ".tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(orjson.dumps(progress, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_file, PROGRESS_FILE)
 
 
 def batch_check_existing_urls(collection, urls):
@@ -494,34 +658,71 @@ def batch_check_existing_urls(collection, urls):
     return existing_urls
 
 
-def process_single_article(article_info, collection, stats_lock, stats):
+def insert_articles(collection, docs):
     """
-    Process a single article: extract content and save to MongoDB.
-    Thread-safe function for parallel processing.
+    Upsert extracted articles keyed by URL with a single unordered bulk write.
+    Articles whose URL is already stored are left untouched.
 
     Args:
-        article_info (dict): Article metadata
         collection: MongoDB collection instance
-        stats_lock (Lock): Thread lock for statistics
-        stats (dict): Statistics dictionary
+        docs (list): Article documents to insert
+
+    Returns:
+        tuple: (inserted count, duplicate count, other error count)
+    """
+    ops = [
+        UpdateOne(
+            {"url": doc["url"]},
+            {"$setOnInsert": {k: v for k, v in doc.items() if k != "url"}},
+            upsert=True,
+        )
+        for doc in docs
+    ]
+    try:
+        result = collection.bulk_write(ops, ordered=False)
+        return result.upserted_count, result.matched_count, 0
+    except BulkWriteError as bwe:
+        details = bwe.details
+        write_errors = details.get("writeErrors", [])
+        # A concurrent insert of the same URL surfaces as a duplicate key error
+        duplicates = sum(1 for err in write_errors if err.get("code") == 11000)
+        return (
+            details.get("nUpserted", 0),
+            details.get("nMatched", 0) + duplicates,
+            len(write_errors) - duplicates,
+        )
+
+
+async def process_single_article(session, semaphore, article_info):
+    """
+    Process a single article: extract content and build its MongoDB document.
+    Documents are inserted per date in one batch (see insert_articles).
+
+    Args:
+        session (aiohttp.ClientSession): Shared HTTP session
+        semaphore (asyncio.Semaphore): Bounds the number of in-flight requests
+        article_info (dict): Article metadata
 
     Returns:
-        tuple: (success, message)
+        tuple: (document or None, message, stats key to count or None)
     """
     article_url = article_info["Article Link"]
 
     try:
-        print(f"  Extracting content from: {article_url}")
+        async with semaphore:
+            print(f"  Extracting content from: {article_url}")
 
-        # Extract article content
-        content = extract_article_content(article_url)
+            # Extract article content
+            content = await extract_article_content(session, article_url)
 
         if content["success"]:
             # Skip if word count is zero
             if content.get("word_count", 0) == 0:
-                with stats_lock:
-                    stats["zero_word_count_skipped"] += 1
-                return (False, f"    ⚠ Skipping - Zero word count")
+                return (
+                    None,
+                    f"    ⚠ Skipping - Zero word count",
+                    "zero_word_count_skipped",
+                )
 
             # Ensure published_date is always set, falling back to archive date
             if not content.get("published_date") and article_info.get("Archive Date"):
@@ -535,68 +736,56 @@ def process_single_article(article_info, collection, stats_lock, stats):
             )
             content["scraped_at"] = datetime.now().isoformat()
 
-            # Insert into MongoDB
-            try:
-                collection.insert_one(content)
-                with stats_lock:
-                    stats["new_articles_added"] += 1
-
-                title_preview = content.get("title", "N/A")[:50]
-                word_count = content.get("word_count", 0)
-                return (True, f"    ✓ Added - {title_preview}... ({word_count} words)")
-            except Exception as e:
-                if "duplicate key" in str(e).lower():
-                    with stats_lock:
-                        stats["duplicates_skipped"] += 1
-                    return (False, f"    ⚠ Duplicate URL skipped")
-                with stats_lock:
-                    stats["extraction_failures"] += 1
-                return (False, f"    ✗ MongoDB error: {str(e)}")
+            title_preview = (content.get("title") or "N/A")[:50]
+            word_count = content.get("word_count", 0)
+            return (
+                content,
+                f"    ✓ Extracted - {title_preview}... ({word_count} words)",
+                None,
+            )
         else:
-            with stats_lock:
-                stats["extraction_failures"] += 1
             return (
-                False,
+                None,
                 f"    ✗ Extraction failed: {content.get('error', 'Unknown')}",
+                "extraction_failures",
             )
 
     except Exception as e:
-        with stats_lock:
-            stats["extraction_failures"] += 1
-        return (False, f"    ✗ Exception: {str(e)}")
+        return (None, f"    ✗ Exception: {str(e)}", "extraction_failures")
 
 
-def generate_date_range(start_date, end_date):
+def iter_date_range(start_date, end_date, skip=frozenset()):
     """
-    Generate a list of dates between start_date and end_date (inclusive).
+    Lazily yield the dates between start_date and end_date (inclusive).
 
     Args:
         start_date (datetime): Start date
         end_date (datetime): End date
+        skip (set): 'YYYY-MM-DD' strings of dates to leave out
 
-    Returns:
-        list: List of datetime objects
+    Yields:
+        tuple: (datetime, 'YYYY-MM-DD' string)
     """
-    dates = []
     current_date = start_date
     while current_date <= end_date:
-        dates.append(current_date)
+        date_str = current_date.strftime("%Y-%m-%d")
+        if date_str not in skip:
+            yield current_date, date_str
         current_date += timedelta(days=1)
-    return dates
 
 
-def scrape_dinamalar_articles(
+async def scrape_dinamalar_articles(
     start_date, end_date, use_cache=True, max_workers=MAX_WORKERS
 ):
     """
     Scrape articles from Dinamalar archive for a date range.
-    Uses parallel processing for article extraction.
+    Article extraction runs concurrently on one aiohttp session.
 
     Args:
         start_date (datetime): Start date
         end_date (datetime): End date
         use_cache (bool): Whether to use cache and resume from last position
-        max_workers (int): Maximum number of parallel workers
+        max_workers (int): Maximum number of concurrent article requests
 
     Returns:
         dict: Statistics of scraping operation
@@ -608,14 +797,12 @@ def scrape_dinamalar_articles(
     completed_dates = set(progress["completed_dates"])
 
     print(f"\nCache status: {len(completed_dates)} dates already scraped")
-    print(f"Using {max_workers} parallel workers for article extraction\n")
+    print(f"Using up to {max_workers} concurrent requests for article extraction\n")
 
     # Get MongoDB collection
     collection = get_mongo_collection()
 
-    # Thread lock for stats updates
-    stats_lock = threading.Lock()
-
+    # Only the date loop updates stats; article tasks report an outcome key
     stats = {
         "total_urls_found": 0,
         "new_articles_added": 0,
@@ -624,96 +811,129 @@ def scrape_dinamalar_articles(
         "extraction_failures": 0,
     }
 
-    # Generate date range
-    dates = generate_date_range(start_date, end_date)
+    # Progress is flushed every PROGRESS_SAVE_EVERY dates rather than on each one
+    dirty = 0
+
+    async def flush_progress():
+        nonlocal dirty
+        await asyncio.to_thread(
+            save_progress, sorted(completed_dates), stats["new_articles_added"]
+        )
+        dirty = 0
+
+    async def mark_completed(date_str):
+        nonlocal dirty
+        completed_dates.add(date_str)
+        dirty += 1
+        if dirty >= PROGRESS_SAVE_EVERY:
+            await flush_progress()
+
+    # Dates already scraped are skipped by the generator itself
+    dates = iter_date_range(
+        start_date, end_date, skip=completed_dates if use_cache else frozenset()
+    )
     print(
-        f"Processing {len(dates)} dates from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
+        f"Processing {(end_date - start_date).days + 1} dates from {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
     )
 
-    for date in dates:
-        date_str = date.strftime("%Y-%m-%d")
-
-        # Skip if already scraped
-        if use_cache and date_str in completed_dates:
-            print(f"Skipping {date_str} (already scraped)")
-            continue
+    connector = aiohttp.TCPConnector(
+        limit=50, limit_per_host=max_workers, ttl_dns_cache=300
+    )
+    async with aiohttp.ClientSession(connector=connector, headers=HEADERS) as session:
+        semaphore = asyncio.Semaphore(max_workers)
 
         try:
-            # Get article URLs for this date
-            article_urls = scrape_dinamalar_articles_for_date(date)
-
-            if not article_urls:
-                print(f"  No articles found for {date_str}")
-                if use_cache:
-                    completed_dates.add(date_str)
-                    save_progress(list(completed_dates), stats["new_articles_added"])
-                continue
+            for date, date_str in dates:
+                try:
+                    # Get article URLs for this date
+                    article_urls = await scrape_dinamalar_articles_for_date(
+                        session, date
+                    )
 
-            stats["total_urls_found"] += len(article_urls)
-
-            # Batch check for existing URLs
-            print(f"  Checking for duplicates...")
-            all_urls = [article["Article Link"] for article in article_urls]
-            existing_urls = batch_check_existing_urls(collection, all_urls)
-
-            # Filter out articles that already exist
-            new_articles = [
-                article
-                for article in article_urls
-                if article["Article Link"] not in existing_urls
-            ]
-
-            duplicates_found = len(article_urls) - len(new_articles)
-            if duplicates_found > 0:
-                with stats_lock:
-                    stats["duplicates_skipped"] += duplicates_found
-                print(
-                    f"  Found {duplicates_found} duplicates, processing {len(new_articles)} new articles"
-                )
+                    # A failed archive fetch leaves the date pending for a rerun
+                    if article_urls is None:
+                        continue
 
-            if not new_articles:
-                print(f"  All articles for {date_str} already exist in database")
-                if use_cache:
-                    completed_dates.add(date_str)
-                    save_progress(list(completed_dates), stats["new_articles_added"])
-                continue
+                    if not article_urls:
+                        print(f"  No articles found for {date_str}")
+                        if use_cache:
+                            await mark_completed(date_str)
+                        continue
 
-            # Process articles in parallel
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_article = {
-                    executor.submit(
-                        process_single_article,
-                        article_info,
-                        collection,
-                        stats_lock,
-                        stats,
-                    ): article_info
-                    for article_info in new_articles
-                }
-
-                for future in as_completed(future_to_article):
-                    try:
-                        success, message = future.result()
-                        print(message)
-                        time.sleep(random.uniform(0.5, 1.5))
-                    except Exception as e:
-                        print(f"    ✗ Task exception: {str(e)}")
-                        with stats_lock:
-                            stats["extraction_failures"] += 1
+                    stats["total_urls_found"] += len(article_urls)
 
-            # Mark date as completed
-            if use_cache:
-                completed_dates.add(date_str)
-                save_progress(list(completed_dates), stats["new_articles_added"])
+                    # Batch check for existing URLs
+                    print(f"  Checking for duplicates...")
+                    all_urls = [article["Article Link"] for article in article_urls]
+                    existing_urls = await asyncio.to_thread(
+                        batch_check_existing_urls, collection, all_urls
+                    )
 
-            print(
-                f"  Date {date_str} completed - Total added: {stats['new_articles_added']}"
-            )
+                    # Filter out articles that already exist
+                    new_articles = [
+                        article
+                        for article in article_urls
+                        if article["Article Link"] not in existing_urls
+                    ]
+
+                    duplicates_found = len(article_urls) - len(new_articles)
+                    if duplicates_found > 0:
+                        stats["duplicates_skipped"] += duplicates_found
+                        print(
+                            f"  Found {duplicates_found} duplicates, processing {len(new_articles)} new articles"
+                        )
+
+                    if not new_articles:
+                        print(
+                            f"  All articles for {date_str} already exist in database"
+                        )
+                        if use_cache:
+                            await mark_completed(date_str)
+                        continue
 
-        except Exception as e:
-            print(f"Error on {date_str}: {e}")
+                    # Process articles concurrently
+                    tasks = [
+                        process_single_article(session, semaphore, article_info)
+                        for article_info in new_articles
+                    ]
+                    docs = []
+                    for task in asyncio.as_completed(tasks):
+                        try:
+                            doc, message, outcome = await task
+                            print(message)
+                            if doc is not None:
+                                docs.append(doc)
+                            if outcome is not None:
+                                stats[outcome] += 1
+                        except Exception as e:
+                            print(f"    ✗ Task exception: {str(e)}")
+                            stats["extraction_failures"] += 1
+
+                    # Insert the whole date's articles in one round trip
+                    if docs:
+                        inserted, duplicates, errors = await asyncio.to_thread(
+                            insert_articles, collection, docs
+                        )
+                        stats["new_articles_added"] += inserted
+                        stats["duplicates_skipped"] += duplicates
+                        stats["extraction_failures"] += errors
+                        print(
+                            f"  Inserted {inserted} articles ({duplicates} duplicates, {errors} errors)"
+                        )
+
+                    # Mark date as completed
+                    if use_cache:
+                        await mark_completed(date_str)
+
+                    print(
+                        f"  Date {date_str} completed - Total added: {stats['new_articles_added']}"
+                    )
 
-        time.sleep(random.uniform(1, 2))
+                except Exception as e:
+                    print(f"Error on {date_str}: {e}")
+        finally:
+            if use_cache and dirty:
+                await flush_progress()
 
     return stats
 
@@ -728,21 +948,22 @@ def main():
     # Format: Year, Month, Day
     START_DATE = datetime(2024, 1, 1)
     END_DATE = datetime(2025, 1, 31)  # Adjust as needed
-    MAX_WORKERS = 5
 
     print(f"\nScraping Dinamalar archive")
     print(
         f"Date range: {START_DATE.strftime('%Y-%m-%d')} to {END_DATE.strftime('%Y-%m-%d')}"
     )
-    print(f"Parallel workers: {MAX_WORKERS}")
+    print(f"Concurrent requests: {MAX_WORKERS}")
     print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
 
     # Scrape articles
-    stats = scrape_dinamalar_articles(
-        start_date=START_DATE,
-        end_date=END_DATE,
-        use_cache=True,
-        max_workers=MAX_WORKERS,
+    stats = asyncio.run(
+        scrape_dinamalar_articles(
+            start_date=START_DATE,
+            end_date=END_DATE,
+            use_cache=True,
+            max_workers=MAX_WORKERS,
+        )
     )
 
     # Display results
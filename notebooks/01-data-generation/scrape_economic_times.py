@@ -3,96 +3,148 @@ Economic Times Archive Article Scraper
 
 This script scrapes article URLs from The Economic Times archive pages.
 Archive URL format: https://economictimes.indiatimes.com/archivelist/year-YYYY,month-MM,starttime-XXXXX.cms
+
+Network I/O runs on asyncio + aiohttp; HTML parsing runs in worker threads.
 """
 
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import calendar
+import aiohttp
+from bs4 import BeautifulSoup, Tag
+from lxml import html as lhtml
+import soupsieve
 import pandas as pd
-import time
-import random
-import json
+import orjson
 import os
 import re
+import time
 from datetime import datetime
 from pymongo import MongoClient
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import threading
-
-# Base URL for Economic Times Archive
-BASE_URL = "https://economictimes.indiatimes.com"
+from pymongo.errors import BulkWriteError
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
-def extract_article_id(url):
-    """Extract article ID from URL."""
-    match = re.search(r"/articleshow/(\d+)", url)
-    return match.group(1) if match else None
-
-
-def clean_content(content):
-    """Clean the content and title."""
-    unwanted_phrases = [
-        "click here",
-        "Click Here",
-        "advertisement",
-        "Subscribe",
-        "Read More",
-        "Learn More",
-        "Join Now",
-        "Get Started",
-        "Sign Up",
-        "Buy Now",
-        "Limited Time Offer",
-        "Act Now",
-        "Don't Miss Out",
-        "Exclusive Deal",
-        "Shop Now",
-        "Download Now",
-        "Try for Free",
-        "Free Trial",
-        "Register Now",
-        "See More",
-        "Follow Us",
-        "Stay Updated",
-        "Get Updates",
-        "Explore More",
-        "More Info",
-        "This Just In",
-        "Breaking News",
-        "Today's Deals",
-        "YOU MAY LIKE",
-        "Post comment",
-        "You can now subscribe to our Economic Times WhatsApp channel",
-        "Preview Sample",
-        "Leadership | Entrepreneurship",
-        "People | Culture",
-        "Download the app",
-        "Download app",
-        "Join the community",
-        "ET Prime",
-        "Also Read",
-        "Recommended For You",
-    ]
-
-    # Remove unwanted phrases (case-insensitive)
-    for phrase in unwanted_phrases:
-        content = re.sub(re.escape(phrase), "", content, flags=re.IGNORECASE)
+try:
+    import re2
+except ImportError:
+    re2 = None
 
-    # Remove HTML tags if any remain
-    content = re.sub(r"<[^>]+>", "", content)
+# Base URL for Economic Times Archive
+BASE_URL = "https://economictimes.indiatimes.com"
 
-    # Remove invalid characters (non-ASCII and words containing unusual symbols)
-    content = re.sub(r"[^\x00-\x7F]+", "", content)
 
-    # Clean up formatting
-    content = re.sub(
-        r"\s+", " ", content
-    )  # Replace multiple whitespace with a single space
-    content = re.sub(r"(?<=[a-zA-Z])(?=\d)", " ", content)  # Add space before digits
-    content = re.sub(
-        r"(?<=[\w])(?=[\W])", " ", content
-    )  # Add space before non-word characters
-    
-    PHRASES_TO_REMOVE = [
+# Compiled once: article ID in ET article URLs
+ARTICLE_ID_RE = re.compile(r"/articleshow/(\d+)")
+
+# Compiled once: archive links worth following are site-relative or absolute
+# and mention "article" or "news" (the ET base URL itself contains neither)
+ARCHIVE_LINK_PREFIXES = ("/", "http")
+ARCHIVE_LINK_KEEP_RE = re.compile(r"article|news")
+
+# ET serves UTF-8; without this libxml2 assumes Latin-1 when a page has no
+# charset declaration. Only used from the event loop thread.
+ARCHIVE_PARSER = lhtml.HTMLParser(encoding="utf-8")
+
+# Boilerplate phrases removed case-insensitively from titles and article text
+UNWANTED_PHRASES = [
+    "click here",
+    "Click Here",
+    "advertisement",
+    "Subscribe",
+    "Read More",
+    "Learn More",
+    "Join Now",
+    "Get Started",
+    "Sign Up",
+    "Buy Now",
+    "Limited Time Offer",
+    "Act Now",
+    "Don't Miss Out",
+    "Exclusive Deal",
+    "Shop Now",
+    "Download Now",
+    "Try for Free",
+    "Free Trial",
+    "Register Now",
+    "See More",
+    "Follow Us",
+    "Stay Updated",
+    "Get Updates",
+    "Explore More",
+    "More Info",
+    "This Just In",
+    "Breaking News",
+    "Today's Deals",
+    "YOU MAY LIKE",
+    "Post comment",
+    "You can now subscribe to our Economic Times WhatsApp channel",
+    "Preview Sample",
+    "Leadership | Entrepreneurship",
+    "People | Culture",
+    "Download the app",
+    "Download app",
+    "Join the community",
+    "ET Prime",
+    "Also Read",
+    "Recommended For You",
+]
+
+# One alternation scans the text once; longest first so that a phrase wins over
+# any shorter phrase it contains (e.g. the WhatsApp line over "Subscribe").
+# RE2 runs this case-insensitive alternation as a DFA, far faster than re;
+# the other patterns stay on re, whose sub() is faster for simple patterns.
+UNWANTED_PHRASES_RE = (re2 or re).compile(
+    "(?i)"
+    + "|".join(
+        re.escape(phrase) for phrase in sorted(UNWANTED_PHRASES, key=len, reverse=True)
+    )
+)
+
+# Compiled once: patterns applied by clean_content on every article and title
+HTML_TAG_RE = re.compile(r"<[^>]+>")
+WHITESPACE_RE = re.compile(r"\s+")
+ALPHA_DIGIT_RE = re.compile(r"(?<=[a-zA-Z])(?=\d)")
+WORD_NONWORD_RE = re.compile(r"(?<=[\w])(?=[\W])")
+
+# Compiled once: site-name suffix on document titles and byline prefixes
+TITLE_SUFFIX_RE = re.compile(
+    r"\s*[-|]\s*(Economic Times|ET|economictimes\.indiatimes\.com).*$", re.IGNORECASE
+)
+AUTHOR_PREFIX_RE = re.compile(r"^(Written by|By|Author:)\s*", re.IGNORECASE)
+
+# Article body containers, in priority order (after the article-ID div)
+BODY_SELECTORS = (
+    "div[class*=contentDivWrapper]",
+    "div.artText",
+    "div.artSyn",
+    "div[itemprop=articleBody]",
+    "article",
+    "main",
+)
+# Compiled once: all body candidates in one walk, plus a matcher per tier
+BODY_SELECTOR = soupsieve.compile(", ".join(BODY_SELECTORS))
+BODY_SELECTOR_TIERS = tuple(soupsieve.compile(selector) for selector in BODY_SELECTORS)
+
+# Last-resort body: first div with "art" or "content" in its class and more
+# than FALLBACK_MIN_TEXT characters of text. The byte pattern is a cheap
+# prefilter on the raw HTML: if no class attribute matches, skip the walk.
+FALLBACK_BODY_SELECTOR = soupsieve.compile("div[class*=art i], div[class*=content i]")
+FALLBACK_CLASS_BYTES_RE = re.compile(
+    rb"""class\s*=\s*["']?[^"'>]*(?:art|content)""", re.IGNORECASE
+)
+FALLBACK_MIN_TEXT = 200
+
+# Elements stripped from the article body before its text is extracted
+NON_CONTENT_TAGS = frozenset(
+    ["script", "style", "nav", "header", "footer", "aside", "iframe"]
+)
+AD_CLASS_KEYWORDS = ("ad", "advertisement", "promo", "social", "share")
+
+# ET page furniture (spaced as it is after tokenising) removed verbatim from text
+PHRASES_TO_REMOVE = [
     "1  2  3  View  all  Stories",
     "trusted news source add economic times whatsapp channel",
     "(What 's  moving  Sensex  and  Nifty  Track  latest  market  news  , stock  tips  , Budget  2025  , Share  Market  on  Budget  2025  and  expert  advice  , on  ETMarkets  . Also , ETMarkets .com  is  now  on  Telegram . For  fastest  news  alerts  on  financial  markets , investment  strategies  and  stocks  alerts , to  our  Telegram  feeds  .)",
@@ -133,11 +185,82 @@ def clean_content(content):
     "Investment  Ideas",
     "Stock  Report  Plus",
     "ePaper  Wealth  Edition",
-    
-    ]
-    
-    for phrase in PHRASES_TO_REMOVE:
-        content = content.replace(phrase, "")
+]
+
+
+def build_phrase_remover(phrases):
+    """
+    Build a function that deletes every occurrence of the given literal phrases
+    in one pass, preferring the leftmost and then the longest match.
+
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, otherwise a
+    longest-first regex alternation (which matches the same spans).
+
+    Args:
+        phrases (list): Literal phrases to remove
+
+    Returns:
+        callable: Function taking a string and returning it without the phrases
+    """
+    if ahocorasick is None:
+        pattern = re.compile(
+            "|".join(map(re.escape, sorted(phrases, key=len, reverse=True)))
+        )
+        return lambda text: pattern.sub("", text)
+
+    automaton = ahocorasick.Automaton()
+    for phrase in phrases:
+        automaton.add_word(phrase, len(phrase))
+    automaton.make_automaton()
+
+    def remove(text):
+        # Matches come back by end index; order them leftmost, then longest
+        spans = sorted(
+            (end - length + 1, -length) for end, length in automaton.iter(text)
+        )
+        if not spans:
+            return text
+        pieces = []
+        pos = 0
+        for start, neg_length in spans:
+            if start >= pos:  # Skip matches overlapping one already removed
+                pieces.append(text[pos:start])
+                pos = start - neg_length
+        pieces.append(text[pos:])
+        return "".join(pieces)
+
+    return remove
+
+
+remove_et_boilerplate = build_phrase_remover(PHRASES_TO_REMOVE)
+
+
+def extract_article_id(url):
+    """Extract article ID from URL."""
+    match = ARTICLE_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
+def clean_content(content):
+    """Clean the content and title."""
+    # Remove unwanted phrases (case-insensitive)
+    content = UNWANTED_PHRASES_RE.sub("", content)
+
+    # Remove HTML tags if any remain
+    content = HTML_TAG_RE.sub("", content)
+
+    # Remove invalid characters (non-ASCII and words containing unusual symbols)
+    # The codec drops them in C, without a regex match per run
+    content = content.encode("ascii", "ignore").decode("ascii")
+
+    # Clean up formatting
+    # Replace multiple whitespace with a single space
+    content = WHITESPACE_RE.sub(" ", content)
+    content = ALPHA_DIGIT_RE.sub(" ", content)  # Add space before digits
+    # Add space before non-word characters
+    content = WORD_NONWORD_RE.sub(" ", content)
+
+    content = remove_et_boilerplate(content)
 
     return content.strip()
 
@@ -149,12 +272,72 @@ INITIAL_STARTTIME = 43829  # Adjust this based on actual ET archive structure
 # Progress tracking
 CACHE_DIR = "cache_economic_times"
 PROGRESS_FILE = os.path.join(CACHE_DIR, "scraping_progress.json")
+# Dates completed since the last full rewrite, one per line
+PROGRESS_JOURNAL = os.path.join(CACHE_DIR, "scraping_progress.jl")
+PROGRESS_SAVE_EVERY = 50  # Dates between progress-file rewrites
 
 # MongoDB Configuration
 MONGO_URI = "mongodb://localhost:27017/"
 MONGO_DB = "test"
 MONGO_COLLECTION = "articles"
 
+# Concurrency Configuration
+MAX_WORKERS = 20  # Maximum article requests in flight at once (across dates)
+MAX_CONCURRENT_DATES = 4  # Dates whose archives are processed at the same time
+REQUESTS_PER_SECOND = 5  # Polite crawl rate across all requests
+
+# HTTP Configuration
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 3
+
+# Request headers shared by every request on the HTTP session
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Connection": "keep-alive",
+}
+
+
+class RateLimiter:
+    """Token-bucket limiter shared by all coroutines (one token per request)."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self.next_slot = time.monotonic()
+
+    async def acquire(self):
+        """Wait until the caller may issue its next request."""
+        # Slot bookkeeping runs without an await, so no lock is needed
+        now = time.monotonic()
+        slot = max(now, self.next_slot)
+        self.next_slot = slot + self.interval
+        await asyncio.sleep(slot - now)
+
+
+rate_limiter = RateLimiter(REQUESTS_PER_SECOND)
+
+
+async def fetch_html(session, url, **kwargs):
+    """
+    GET a URL, retrying 429/5xx responses with exponential backoff.
+
+    Args:
+        session (aiohttp.ClientSession): Shared HTTP session
+        url (str): URL to fetch
+        **kwargs: Extra arguments for session.get (e.g. headers)
+
+    Returns:
+        tuple: (HTTP status code, response body bytes)
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        await rate_limiter.acquire()
+        async with session.get(url, timeout=REQUEST_TIMEOUT, **kwargs) as response:
+            if response.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                return response.status, await response.read()
+        await asyncio.sleep(2**attempt)
+
 
 # Initialize MongoDB connection
 def get_mongo_collection():
@@ -167,31 +350,191 @@ def get_mongo_collection():
     return collection
 
 
-def extract_article_content(url):
+def is_non_content(element):
     """
-    Extract the full content of an article from Economic Times.
-    Adapted from Indian Express extraction logic.
+    Check whether a tag is a non-content element or an ad/social block.
+
+    Args:
+        element (Tag): Tag inside the article body
+
+    Returns:
+        bool: True if the tag and its subtree should be left out of the text
+    """
+    if element.name in NON_CONTENT_TAGS:
+        return True
+    classes = element.get("class")
+    if classes:
+        class_text = " ".join(classes).lower()
+        return any(keyword in class_text for keyword in AD_CLASS_KEYWORDS)
+    return False
+
+
+def extract_body_text(article_body):
+    """
+    Extract the text of an article body, leaving out non-content elements.
+
+    Equivalent to removing every is_non_content() subtree and then calling
+    get_text(separator=" ", strip=True), but done in a single walk that
+    skips those subtrees and joins the strings once.
+
+    Args:
+        article_body (Tag): Article container (not modified)
+
+    Returns:
+        str: Space-separated stripped text
+    """
+    # Same string types get_text() keeps: not comments, script or style text
+    string_types = article_body.interesting_string_types
+    if isinstance(string_types, type):
+        string_types = (string_types,)
+
+    parts = []
+    stack = [iter(article_body.contents)]
+    while stack:
+        for node in stack[-1]:
+            if isinstance(node, Tag):
+                if not is_non_content(node):
+                    stack.append(iter(node.contents))
+                    break
+            elif type(node) in string_types:
+                text = node.strip()
+                if text:
+                    parts.append(text)
+        else:
+            stack.pop()
+    return " ".join(parts)
+
+
+async def extract_article_content(session, url):
+    """
+    Fetch an article from Economic Times and extract its content.
+    Parsing runs in a worker thread so the event loop keeps fetching.
 
     Args:
+        session (aiohttp.ClientSession): Shared HTTP session
         url (str): Article URL
 
     Returns:
         dict: Dictionary containing article content and metadata
     """
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.5",
-        "Connection": "keep-alive",
-    }
+    try:
+        status, html = await fetch_html(session, url)
+    except asyncio.TimeoutError:
+        return {"success": False, "url": url, "error": "Timeout"}
+    except aiohttp.ClientError as e:
+        return {"success": False, "url": url, "error": str(e)}
+
+    if status != 200:
+        return {"success": False, "error": f"HTTP {status}"}
+
+    return await asyncio.to_thread(parse_article_content, url, html)
+
+
+def find_article_body(soup):
+    """
+    Find the article body container, trying BODY_SELECTORS in priority order.
+
+    All candidates are collected in a single walk of the tree, then the first
+    match of the highest-priority selector is returned.
+
+    Args:
+        soup (BeautifulSoup): Parsed article page
+
+    Returns:
+        Tag or None: The body container, if any selector matched
+    """
+    first_match = {}
+    for element in BODY_SELECTOR.select(soup):
+        for rank, tier in enumerate(BODY_SELECTOR_TIERS):
+            if rank not in first_match and tier.match(element):
+                first_match[rank] = element
+        if 0 in first_match:
+            break
+
+    for rank in range(len(BODY_SELECTORS)):
+        if rank in first_match:
+            return first_match[rank]
+    return None
+
+
+def has_text_longer_than(element, min_length):
+    """
+    Check whether an element's stripped text is longer than min_length,
+    without walking the rest of its subtree once the answer is known.
+
+    Args:
+        element (Tag): Element to measure
+        min_length (int): Length the text must exceed
+
+    Returns:
+        bool: True if len(element.get_text(strip=True)) > min_length
+    """
+    total = 0
+    for text in element.stripped_strings:
+        total += len(text)
+        if total > min_length:
+            return True
+    return False
+
+
+def parse_json_ld(soup):
+    """
+    Parse the page's JSON-LD block, if it has a usable one.
 
+    Args:
+        soup (BeautifulSoup): Parsed article page
+
+    Returns:
+        dict: JSON-LD object, or an empty dict if missing or invalid
+    """
+    json_ld = soup.find("script", type="application/ld+json")
+    if not json_ld or not json_ld.string:
+        return {}
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        # orjson only accepts exact str, not bs4's str subclasses
+        data = orjson.loads(str(json_ld.string))
+    except orjson.JSONDecodeError:
+        return {}
+    if isinstance(data, list):
+        data = data[0] if data else None
+    return data if isinstance(data, dict) else {}
+
+
+def json_ld_author(author):
+    """
+    Format a JSON-LD author value (object, list of objects or plain name).
+
+    Args:
+        author: Value of the JSON-LD "author" field
+
+    Returns:
+        str: Author name(s), or None if not recognised
+    """
+    if isinstance(author, dict):
+        return author.get("name")
+    if isinstance(author, list):
+        return ", ".join(
+            [a.get("name", "") if isinstance(a, dict) else str(a) for a in author]
+        )
+    if isinstance(author, str):
+        return author
+    return None
+
+
+def parse_article_content(url, html):
+    """
+    Extract the full content of an article from Economic Times.
+    Adapted from Indian Express extraction logic.
 
-        if response.status_code != 200:
-            return {"success": False, "error": f"HTTP {response.status_code}"}
+    Args:
+        url (str): Article URL
+        html (bytes): Raw article HTML
 
-        soup = BeautifulSoup(response.content, "html.parser")
+    Returns:
+        dict: Dictionary containing article content and metadata
+    """
+    try:
+        soup = BeautifulSoup(html, "lxml")
 
         # Initialize result dictionary
         article_data = {
@@ -208,124 +551,106 @@ def extract_article_content(url):
             "error": None,
         }
 
-        # Try article ID-based extraction first
+        # Metadata comes from JSON-LD first; the DOM is only searched for
+        # fields it does not provide
+        ld = parse_json_ld(soup)
         article_id = extract_article_id(url)
-        main_div = None
-        if article_id:
-            main_div = soup.find("div", {"data-article_id": article_id})
+
+        if ld.get("headline"):
+            article_data["title"] = clean_content(str(ld["headline"]))
+        if ld.get("author"):
+            article_data["author"] = json_ld_author(ld["author"])
+        article_data["published_date"] = ld.get("datePublished")
+        article_data["modified_date"] = ld.get("dateModified")
+        section = ld.get("articleSection")
+        if isinstance(section, list):
+            section = ", ".join(map(str, section))
+        article_data["section"] = section or None
+        keywords = ld.get("keywords")
+        if isinstance(keywords, list):
+            keywords = ",".join(map(str, keywords))
+        article_data["tags"] = keywords or None
 
         # Extract title (ET specific)
-        title_tag = None
-        if main_div:
-            title_tag = main_div.find("h1", class_="artTitle")
-        if not title_tag:
-            title_tag = soup.find("h1", class_="artTitle")
-        if not title_tag:
-            title_tag = soup.find("h1")
+        if not article_data["title"]:
+            # Try article ID-based extraction first
+            title_tag = None
+            if article_id:
+                main_div = soup.find("div", {"data-article_id": article_id})
+                if main_div:
+                    title_tag = main_div.find("h1", class_="artTitle")
+            if not title_tag:
+                title_tag = soup.find("h1", class_="artTitle")
+            if not title_tag:
+                title_tag = soup.find("h1")
+            if title_tag:
+                article_data["title"] = clean_content(title_tag.get_text(strip=True))
 
         # Use document title as fallback
-        if title_tag:
-            article_data["title"] = clean_content(title_tag.get_text(strip=True))
         if not article_data["title"]:
             doc_title = soup.find("title")
             if doc_title:
                 # Clean document title (remove site name, etc.)
                 title_text = doc_title.get_text(strip=True)
                 # Remove common suffixes like "- Economic Times"
-                title_text = re.sub(
-                    r"\s*[-|]\s*(Economic Times|ET|economictimes\.indiatimes\.com).*$",
-                    "",
-                    title_text,
-                    flags=re.IGNORECASE,
-                )
+                title_text = TITLE_SUFFIX_RE.sub("", title_text)
                 article_data["title"] = clean_content(title_text)
 
         # Extract author (ET specific)
-        author_tag = soup.find("div", class_="auth-nm")
-        if not author_tag:
-            author_tag = soup.find("a", rel="author")
-        if author_tag:
-            author_text = author_tag.get_text(strip=True)
-            author_text = re.sub(
-                r"^(Written by|By|Author:)\s*", "", author_text, flags=re.IGNORECASE
-            )
-            article_data["author"] = author_text
+        if not article_data["author"]:
+            author_tag = soup.find("div", class_="auth-nm")
+            if not author_tag:
+                author_tag = soup.find("a", rel="author")
+            if author_tag:
+                author_text = author_tag.get_text(strip=True)
+                author_text = AUTHOR_PREFIX_RE.sub("", author_text)
+                article_data["author"] = author_text
 
         # Extract published date from meta tags
-        date_meta = soup.find("meta", property="article:published_time")
-        if date_meta:
-            article_data["published_date"] = date_meta.get("content")
+        if not article_data["published_date"]:
+            date_meta = soup.find("meta", property="article:published_time")
+            if date_meta:
+                article_data["published_date"] = date_meta.get("content")
 
         # Try modified date
-        modified_meta = soup.find("meta", property="article:modified_time")
-        if modified_meta:
-            article_data["modified_date"] = modified_meta.get("content")
+        if not article_data["modified_date"]:
+            modified_meta = soup.find("meta", property="article:modified_time")
+            if modified_meta:
+                article_data["modified_date"] = modified_meta.get("content")
 
         # Extract section/category
-        section_meta = soup.find("meta", property="article:section")
-        if section_meta:
-            article_data["section"] = section_meta.get("content")
+        if not article_data["section"]:
+            section_meta = soup.find("meta", property="article:section")
+            if section_meta:
+                article_data["section"] = section_meta.get("content")
 
         # Extract tags
-        tag_meta = soup.find("meta", {"name": "keywords"})
-        if tag_meta:
-            article_data["tags"] = tag_meta.get("content")
+        if not article_data["tags"]:
+            tag_meta = soup.find("meta", {"name": "keywords"})
+            if tag_meta:
+                article_data["tags"] = tag_meta.get("content")
 
         # Extract article text/body - Simplified approach
-        # Find the article container using multiple fallback selectors
+        # Find the article container, most specific first
         article_body = None
-
-        # Try various selectors in order of specificity
-        selectors = [
-            ("div", {"data-article_id": article_id}) if article_id else None,
-            ("div", {"class": lambda x: x and "contentDivWrapper" in str(x)}),
-            ("div", {"class": "artText"}),
-            ("div", {"class": "artSyn"}),
-            ("div", {"itemprop": "articleBody"}),
-            ("article", {}),
-            ("main", {}),
-        ]
-
-        for selector in selectors:
-            if selector is None:
-                continue
-            tag, attrs = selector
-            article_body = soup.find(tag, attrs)
-            if article_body:
-                break
+        if article_id:
+            article_body = soup.find("div", {"data-article_id": article_id})
+        if not article_body:
+            article_body = find_article_body(soup)
 
         # Last resort: find div with "art" in class that has substantial content
-        if not article_body:
-            potential_divs = soup.find_all("div", class_=True)
-            for div in potential_divs:
-                classes = " ".join(div.get("class", []))
-                if "art" in classes.lower() or "content" in classes.lower():
-                    text_length = len(div.get_text(strip=True))
-                    if text_length > 200:  # Has substantial text
-                        article_body = div
-                        break
+        if not article_body and FALLBACK_CLASS_BYTES_RE.search(html):
+            for div in FALLBACK_BODY_SELECTOR.iselect(soup):
+                if has_text_longer_than(div, FALLBACK_MIN_TEXT):
+                    article_body = div
+                    break
 
         # Extract all text from article body
         raw_article_text = ""
         if article_body:
-            # Remove unwanted elements
-            for element in article_body.find_all(
-                ["script", "style", "nav", "header", "footer", "aside", "iframe"]
-            ):
-                element.decompose()
-
-            # Remove ads and navigation elements by class
-            for element in article_body.find_all(
-                class_=lambda x: x
-                and any(
-                    keyword in str(x).lower()
-                    for keyword in ["ad", "advertisement", "promo", "social", "share"]
-                )
-            ):
-                element.decompose()
-
-            # Extract ALL remaining text
-            raw_article_text = article_body.get_text(separator=" ", strip=True)
+            # Extract ALL text, skipping unwanted elements, ads and navigation
+            # elements by class
+            raw_article_text = extract_body_text(article_body)
 
         # Clean the extracted text using existing clean_content function
         article_data["article_text"] = (
@@ -337,48 +662,19 @@ def extract_article_content(url):
             else 0
         )
 
-        # If no article text found, try JSON-LD data
+        # If no article text found, use the JSON-LD article body
         if not article_data["article_text"] or article_data["word_count"] < 50:
-            json_ld = soup.find("script", type="application/ld+json")
-            if json_ld:
-                try:
-                    data = json.loads(json_ld.string)
-                    if isinstance(data, list):
-                        data = data[0]
-
-                    if "articleBody" in data:
-                        article_data["article_text"] = data["articleBody"]
-                        article_data["word_count"] = len(
-                            article_data["article_text"].split()
-                        )
-
-                    if not article_data["title"] and "headline" in data:
-                        article_data["title"] = data["headline"]
-                    if not article_data["author"] and "author" in data:
-                        if isinstance(data["author"], dict):
-                            article_data["author"] = data["author"].get("name")
-                        elif isinstance(data["author"], list):
-                            article_data["author"] = ", ".join(
-                                [a.get("name", "") for a in data["author"]]
-                            )
-                    if not article_data["published_date"] and "datePublished" in data:
-                        article_data["published_date"] = data["datePublished"]
-                    if not article_data["modified_date"] and "dateModified" in data:
-                        article_data["modified_date"] = data["dateModified"]
-                except json.JSONDecodeError:
-                    pass
+            if "articleBody" in ld:
+                article_data["article_text"] = ld["articleBody"]
+                article_data["word_count"] = len(article_data["article_text"].split())
 
         return article_data
 
-    except requests.exceptions.Timeout:
-        return {"success": False, "url": url, "error": "Timeout"}
-    except requests.exceptions.RequestException as e:
-        return {"success": False, "url": url, "error": str(e)}
     except Exception as e:
         return {"success": False, "url": url, "error": str(e)}
 
 
-def scrape_et_articles_for_date(year, month, day):
+async def scrape_et_articles_for_date(session, year, month, day):
     """
     Scrape article links for a specific date from Economic Times archive.
 
@@ -386,6 +682,7 @@ def scrape_et_articles_for_date(year, month, day):
     that increments daily from a base date.
 
     Args:
+        session (aiohttp.ClientSession): Shared HTTP session
         year (int): Year
         month (int): Month (1-12)
         day (int): Day (1-31)
@@ -407,51 +704,48 @@ def scrape_et_articles_for_date(year, month, day):
     url = f"{BASE_URL}/archivelist/year-{year},month-{month},starttime-{starttime}.cms"
     print(f"Scraping URL: {url}")
 
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.5",
-        "Referer": BASE_URL,
-        "Connection": "keep-alive",
-    }
-
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        status, html = await fetch_html(session, url, headers={"Referer": BASE_URL})
 
-        if response.status_code != 200:
-            print(
-                f"Failed to retrieve data from {url} - Status code: {response.status_code}"
-            )
+        if status != 200:
+            print(f"Failed to retrieve data from {url} - Status code: {status}")
             return []
 
-        soup = BeautifulSoup(response.content, "html.parser")
-
-        # Find all article links on the page and filter out ads
-        articles = soup.find_all("a", href=True)
+        # Only anchors matter, so lxml parses the raw bytes and its link
+        # iterator is walked directly instead of decoding into a soup
+        links = ()
+        if html.strip():
+            links = lhtml.fromstring(html, parser=ARCHIVE_PARSER).iterlinks()
 
         # Extracting article links and returning them
         article_links = []
-        for article in articles:
-            link = article["href"]
+        seen_links = set()
+        keep_link = ARCHIVE_LINK_KEEP_RE.search
+        for element, attribute, link, _ in links:
+            # Find all article links on the page and filter out ads
+            if attribute != "href" or element.tag != "a":
+                continue
 
             # Check if the link is an article link and not an ad or unrelated link
-            if link.startswith("/") or link.startswith("http"):
-                full_link = BASE_URL + link if link.startswith("/") else link
-
-                # Filter criteria to exclude ads or unrelated links
-                # ET-specific filtering logic
-                if "article" in full_link or "news" in full_link:
-                    # Add to list if not already present
-                    if full_link not in [
-                        item["Article Link"] for item in article_links
-                    ]:
-                        article_links.append(
-                            {
-                                "Media Name": "THE ECONOMIC TIMES",
-                                "Article Link": full_link,
-                                "Date": date_str,
-                            }
-                        )
+            if not link.startswith(ARCHIVE_LINK_PREFIXES):
+                continue
+            full_link = BASE_URL + link if link[0] == "/" else link
+
+            # Filter criteria to exclude ads or unrelated links
+            # ET-specific filtering logic
+            if not keep_link(full_link):
+                continue
+
+            # Add to list if not already present
+            if full_link not in seen_links:
+                seen_links.add(full_link)
+                article_links.append(
+                    {
+                        "Media Name": "THE ECONOMIC TIMES",
+                        "Article Link": full_link,
+                        "Date": date_str,
+                    }
+                )
 
         print(f"Found {len(article_links)} articles for {date_str}")
         return article_links
@@ -462,56 +756,122 @@ def scrape_et_articles_for_date(year, month, day):
 
 
 def load_progress():
-    """Load scraping progress from cache."""
+    """Load scraping progress from cache, replaying the journal if present."""
+    progress = {"completed_dates": [], "last_date": None}
     if os.path.exists(PROGRESS_FILE):
-        with open(PROGRESS_FILE, "r") as f:
-            return json.load(f)
-    return {"completed_dates": [], "last_date": None}
+        with open(PROGRESS_FILE, "rb") as f:
+            progress = orjson.loads(f.read())
+    if os.path.exists(PROGRESS_JOURNAL):
+        with open(PROGRESS_JOURNAL, "r") as f:
+            journal_dates = [line.strip() for line in f if line.strip()]
+        if journal_dates:
+            progress["completed_dates"] = list(
+                set(progress["completed_dates"]).union(journal_dates)
+            )
+            progress["last_date"] = journal_dates[-1]
+    return progress
+
+
+def journal_progress(date_str):
+    """Append a completed date to the progress journal."""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(PROGRESS_JOURNAL, "a") as f:
+        f.write(date_str + "\n")
 
 
 def save_progress(completed_dates, last_date):
-    """Save scraping progress to cache."""
+    """Save scraping progress to cache (atomically) and reset the journal."""
     os.makedirs(CACHE_DIR, exist_ok=True)
     progress = {
         "completed_dates": completed_dates,
         "last_date": last_date,
         "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
     }
-    with open(PROGRESS_FILE, "w") as f:
-        json.dump(progress, f, indent=2)
+    tmp_file = PROGRESS_FILE + ".tmp"
+    with open(tmp_file, "wb") as f:
+        f.write(orjson.dumps(progress, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_file, PROGRESS_FILE)
+    # Everything journaled so far is now in the snapshot
+    if os.path.exists(PROGRESS_JOURNAL):
+        os.remove(PROGRESS_JOURNAL)
 
 
-def batch_check_existing_urls(collection, urls):
+def load_known_urls(collection):
     """
-    Check which URLs already exist in MongoDB using a single batch query.
+    Load every URL already stored in MongoDB into memory.
+    Streams a projection cursor rather than using distinct(), whose single
+    result document is capped at 16 MB.
+
+    Args:
+        collection: MongoDB collection instance
+
+    Returns:
+        set: URLs already in the database
+    """
+    return {doc["url"] for doc in collection.find({}, {"url": 1, "_id": 0})}
+
+
+def batch_check_existing_urls(collection, urls, known_urls):
+    """
+    Check which URLs already exist, consulting MongoDB only for URLs that
+    are not in the in-memory set (e.g. ones stored by another process).
 
     Args:
         collection: MongoDB collection instance
         urls (list): List of URLs to check
+        known_urls (set): URLs known to be stored; updated with any found
 
     Returns:
         set: Set of URLs that already exist in the database
     """
-    if not urls:
-        return set()
+    existing_urls = {url for url in urls if url in known_urls}
+    candidates = [url for url in urls if url not in known_urls]
+    if not candidates:
+        return existing_urls
 
     # Use $in operator to find all matching URLs in a single query
-    existing_docs = collection.find({"url": {"$in": urls}}, {"url": 1})
-    existing_urls = {doc["url"] for doc in existing_docs}
+    existing_docs = collection.find({"url": {"$in": candidates}}, {"url": 1})
+    found = {doc["url"] for doc in existing_docs}
+    known_urls.update(found)
 
-    return existing_urls
+    return existing_urls | found
 
 
-def process_single_article(article_info, collection, stats_lock, stats):
+def insert_articles(collection, docs):
     """
-    Process a single article: extract content and save to MongoDB.
-    Thread-safe function for parallel processing.
-    Note: Duplicate check is now done in batch before threading.
+    Insert extracted articles with a single unordered insert_many.
+    The unique URL index rejects articles that are already stored.
 
     Args:
-        article_info (dict): Article metadata (URL, date, etc.)
         collection: MongoDB collection instance
-        stats_lock: Threading lock for updating stats
+        docs (list): Article documents to insert
+
+    Returns:
+        tuple: (inserted count, duplicate count, other error count)
+    """
+    try:
+        result = collection.insert_many(
+            docs, ordered=False, bypass_document_validation=True
+        )
+        return len(result.inserted_ids), 0, 0
+    except BulkWriteError as bwe:
+        details = bwe.details
+        write_errors = details.get("writeErrors", [])
+        duplicates = sum(1 for err in write_errors if err.get("code") == 11000)
+        return details.get("nInserted", 0), duplicates, len(write_errors) - duplicates
+
+
+async def process_single_article(session, semaphore, article_info, pending, stats):
+    """
+    Process a single article: extract content and queue it for MongoDB.
+    Note: Duplicate check is done in batch before the articles are scheduled,
+    and queued articles are inserted per date (see insert_articles).
+
+    Args:
+        session (aiohttp.ClientSession): Shared HTTP session
+        semaphore (asyncio.Semaphore): Bounds the number of in-flight requests
+        article_info (dict): Article metadata (URL, date, etc.)
+        pending (list): Articles of this date waiting to be inserted
         stats (dict): Statistics dictionary
 
     Returns:
@@ -520,16 +880,16 @@ def process_single_article(article_info, collection, stats_lock, stats):
     article_url = article_info["Article Link"]
 
     try:
-        print(f"  Extracting content from: {article_url}")
+        async with semaphore:
+            print(f"  Extracting content from: {article_url}")
 
-        # Extract article content
-        content = extract_article_content(article_url)
+            # Extract article content
+            content = await extract_article_content(session, article_url)
 
         if content["success"]:
             # Skip if word count is zero
             if content.get("word_count", 0) == 0:
-                with stats_lock:
-                    stats["zero_word_count_skipped"] += 1
+                stats["zero_word_count_skipped"] += 1
                 return (
                     False,
                     f"    ⚠ Skipping - Zero word count (likely not an article)",
@@ -541,46 +901,64 @@ def process_single_article(article_info, collection, stats_lock, stats):
             content["scrape_date"] = article_info["Date"]
             content["scraped_at"] = datetime.now().isoformat()
 
-            # Insert into MongoDB
-            try:
-                collection.insert_one(content)
-                with stats_lock:
-                    stats["new_articles_added"] += 1
+            # Queue for the per-date MongoDB insert
+            pending.append(content)
 
-                title_preview = content.get("title", "N/A")[:60]
-                word_count = content.get("word_count", 0)
-                return (
-                    True,
-                    f"    ✓ Added to MongoDB - Title: {title_preview}...\n      Word count: {word_count}",
-                )
-            except Exception as e:
-                with stats_lock:
-                    stats["extraction_failures"] += 1
-                return (False, f"    ✗ MongoDB insert error: {str(e)}")
+            title_preview = content.get("title", "N/A")[:60]
+            word_count = content.get("word_count", 0)
+            return (
+                True,
+                f"    ✓ Extracted - Title: {title_preview}...\n      Word count: {word_count}",
+            )
         else:
-            with stats_lock:
-                stats["extraction_failures"] += 1
+            stats["extraction_failures"] += 1
             return (
                 False,
                 f"    ✗ Extraction failed: {content.get('error', 'Unknown')}",
             )
 
     except Exception as e:
-        with stats_lock:
-            stats["extraction_failures"] += 1
+        stats["extraction_failures"] += 1
         return (False, f"    ✗ Exception: {str(e)}")
 
 
-def scrape_et_articles(start_year=2020, end_year=2024, use_cache=True, max_workers=5):
+def generate_dates(start_year, end_year):
+    """
+    List every date from the start of start_year to the end of end_year.
+
+    Args:
+        start_year (int): Starting year
+        end_year (int): Ending year (inclusive)
+
+    Returns:
+        list: (year, month, day, 'YYYY-MM-DD' string) tuples in date order
+    """
+    return [
+        (year, month, day, f"{year}-{month:02d}-{day:02d}")
+        for year in range(start_year, end_year + 1)
+        for month in range(1, 13)
+        for day in range(1, calendar.monthrange(year, month)[1] + 1)
+    ]
+
+
+async def scrape_et_articles(
+    start_year=2020,
+    end_year=2024,
+    use_cache=True,
+    max_workers=MAX_WORKERS,
+    max_concurrent_dates=MAX_CONCURRENT_DATES,
+):
     """
     Scrape articles for a date range with caching support and MongoDB storage.
-    Uses parallel processing for article extraction.
+    Several dates are processed at once and their article fetches share one
+    bounded pool of concurrent requests on a single aiohttp session.
 
     Args:
         start_year (int): Starting year
         end_year (int): Ending year (inclusive)
         use_cache (bool): Whether to use cache and resume from last position
-        max_workers (int): Maximum number of parallel workers for article extraction
+        max_workers (int): Maximum number of concurrent article requests
+        max_concurrent_dates (int): Maximum number of dates processed at once
 
     Returns:
         dict: Statistics of scraping operation
@@ -594,14 +972,14 @@ def scrape_et_articles(start_year=2020, end_year=2024, use_cache=True, max_worke
     print(f"\nCache status: {len(completed_dates)} dates already scraped")
     if progress["last_date"]:
         print(f"Last scraped date: {progress['last_date']}")
-    print(f"Using {max_workers} parallel workers for article extraction\n")
+    print(f"Using up to {max_workers} concurrent requests for article extraction\n")
 
-    # Get MongoDB collection
+    # Get MongoDB collection and the URLs it already holds
     collection = get_mongo_collection()
+    known_urls = await asyncio.to_thread(load_known_urls, collection)
+    print(f"Loaded {len(known_urls)} known article URLs from MongoDB")
 
-    # Thread lock for stats updates
-    stats_lock = threading.Lock()
-
+    # All updates happen on the event loop thread, so no lock is needed
     stats = {
         "total_urls_found": 0,
         "new_articles_added": 0,
@@ -610,108 +988,125 @@ def scrape_et_articles(start_year=2020, end_year=2024, use_cache=True, max_worke
         "extraction_failures": 0,
     }
 
-    for year in range(start_year, end_year + 1):
-        for month in range(1, 13):
-            # Get the number of days in the month
-            if month in [1, 3, 5, 7, 8, 10, 12]:
-                num_days = 31
-            elif month in [4, 6, 9, 11]:
-                num_days = 30
-            else:  # February
-                num_days = (
-                    29 if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0) else 28
+    # Each completed date is journaled; the full progress file is rewritten
+    # only every PROGRESS_SAVE_EVERY dates and once more at the end
+    unsaved = 0
+    last_date = progress["last_date"]
+
+    def flush_progress():
+        nonlocal unsaved
+        save_progress(sorted(completed_dates), last_date)
+        unsaved = 0
+
+    def mark_completed(date_str):
+        nonlocal unsaved, last_date
+        if not use_cache:
+            return
+        completed_dates.add(date_str)
+        last_date = date_str
+        journal_progress(date_str)
+        unsaved += 1
+        if unsaved >= PROGRESS_SAVE_EVERY:
+            flush_progress()
+
+    async def process_date(session, semaphore, year, month, day, date_str):
+        article_urls = await scrape_et_articles_for_date(session, year, month, day)
+        stats["total_urls_found"] += len(article_urls)
+
+        if not article_urls:
+            # Mark date as completed even if no articles found
+            mark_completed(date_str)
+            return
+
+        # Batch check for existing URLs to avoid duplicate processing
+        print(f"  Checking for duplicates in batch...")
+        all_urls = [article["Article Link"] for article in article_urls]
+        existing_urls = await asyncio.to_thread(
+            batch_check_existing_urls, collection, all_urls, known_urls
+        )
+
+        # Filter out articles that already exist
+        new_articles = [
+            article
+            for article in article_urls
+            if article["Article Link"] not in existing_urls
+        ]
+
+        duplicates_found = len(article_urls) - len(new_articles)
+        if duplicates_found > 0:
+            stats["duplicates_skipped"] += duplicates_found
+            print(
+                f"  Found {duplicates_found} duplicates, processing {len(new_articles)} new articles"
+            )
+
+        if not new_articles:
+            print(f"  All articles for {date_str} already exist in database")
+            # Mark date as completed
+            mark_completed(date_str)
+            return
+
+        # Process only new articles concurrently
+        pending = []
+        tasks = [
+            process_single_article(session, semaphore, article_info, pending, stats)
+            for article_info in new_articles
+        ]
+        for task in asyncio.as_completed(tasks):
+            try:
+                success, message = await task
+                print(message)
+            except Exception as e:
+                print(f"    ✗ Task exception: {str(e)}")
+                stats["extraction_failures"] += 1
+
+        # Insert the date's articles in one round trip; URLs stored meanwhile
+        # by another date are rejected by the unique index
+        if pending:
+            try:
+                inserted, duplicates, errors = await asyncio.to_thread(
+                    insert_articles, collection, pending
                 )
+            except Exception as e:
+                print(f"  ✗ MongoDB insert error: {str(e)}")
+                inserted, duplicates, errors = 0, 0, len(pending)
+            stats["new_articles_added"] += inserted
+            stats["duplicates_skipped"] += duplicates
+            stats["extraction_failures"] += errors
+            if not errors:
+                # Every queued URL is now stored (inserted or already there)
+                known_urls.update(doc["url"] for doc in pending)
+            print(f"  ✓ Added {inserted} articles to MongoDB for {date_str}")
+
+        # Mark date as completed
+        mark_completed(date_str)
+
+    # Each date worker pulls the next pending date from this shared iterator
+    all_dates = generate_dates(start_year, end_year)
+    pending_dates = iter(
+        [date for date in all_dates if not (use_cache and date[3] in completed_dates)]
+    )
 
-            for day in range(1, num_days + 1):
-                date_str = f"{year}-{month:02d}-{day:02d}"
-
-                # Skip if already scraped
-                if use_cache and date_str in completed_dates:
-                    print(f"Skipping {date_str} (already scraped)")
-                    continue
-
-                try:
-                    article_urls = scrape_et_articles_for_date(year, month, day)
-                    stats["total_urls_found"] += len(article_urls)
-
-                    if not article_urls:
-                        # Mark date as completed even if no articles found
-                        if use_cache:
-                            completed_dates.add(date_str)
-                            save_progress(list(completed_dates), date_str)
-                        continue
-
-                    # Batch check for existing URLs to avoid duplicate processing
-                    print(f"  Checking for duplicates in batch...")
-                    all_urls = [article["Article Link"] for article in article_urls]
-                    existing_urls = batch_check_existing_urls(collection, all_urls)
-
-                    # Filter out articles that already exist
-                    new_articles = [
-                        article
-                        for article in article_urls
-                        if article["Article Link"] not in existing_urls
-                    ]
-
-                    duplicates_found = len(article_urls) - len(new_articles)
-                    if duplicates_found > 0:
-                        with stats_lock:
-                            stats["duplicates_skipped"] += duplicates_found
-                        print(
-                            f"  Found {duplicates_found} duplicates, processing {len(new_articles)} new articles"
-                        )
-
-                    if not new_articles:
-                        print(
-                            f"  All articles for {date_str} already exist in database"
-                        )
-                        # Mark date as completed
-                        if use_cache:
-                            completed_dates.add(date_str)
-                            save_progress(list(completed_dates), date_str)
-                        continue
-
-                    # Process only new articles in parallel using ThreadPoolExecutor
-                    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                        # Submit all article processing tasks
-                        future_to_article = {
-                            executor.submit(
-                                process_single_article,
-                                article_info,
-                                collection,
-                                stats_lock,
-                                stats,
-                            ): article_info
-                            for article_info in new_articles
-                        }
-
-                        # Process completed tasks as they finish
-                        for future in as_completed(future_to_article):
-                            article_info = future_to_article[future]
-                            try:
-                                success, message = future.result()
-                                print(message)
-
-                                # Small delay to avoid overwhelming the server
-                                time.sleep(random.uniform(0.5, 1.5))
-                            except Exception as e:
-                                print(
-                                    f"    ✗ Task exception for {article_info['Article Link']}: {str(e)}"
-                                )
-                                with stats_lock:
-                                    stats["extraction_failures"] += 1
-
-                    # Mark date as completed
-                    if use_cache:
-                        completed_dates.add(date_str)
-                        save_progress(list(completed_dates), date_str)
-
-                except Exception as e:
-                    print(f"Error on {date_str}: {e}")
-                    continue
-
-                # Random delay between dates
-                time.sleep(random.uniform(1, 2))
+    async def date_worker(session, semaphore):
+        for year, month, day, date_str in pending_dates:
+            try:
+                await process_date(session, semaphore, year, month, day, date_str)
+            except Exception as e:
+                print(f"Error on {date_str}: {e}")
+
+    connector = aiohttp.TCPConnector(
+        limit=50, limit_per_host=max_workers, ttl_dns_cache=300
+    )
+    try:
+        async with aiohttp.ClientSession(
+            connector=connector, headers=HEADERS
+        ) as session:
+            semaphore = asyncio.Semaphore(max_workers)
+            await asyncio.gather(
+                *(date_worker(session, semaphore) for _ in range(max_concurrent_dates))
+            )
+    finally:
+        if unsaved:
+            flush_progress()
 
     return stats
 
@@ -725,18 +1120,19 @@ def main():
     # Configure date range and parallelization here
     START_YEAR = 2020
     END_YEAR = 2025
-    MAX_WORKERS = 5  # Number of parallel workers for article extraction
 
     print(f"\nScraping articles from {START_YEAR} to {END_YEAR}")
-    print(f"Parallel workers: {MAX_WORKERS}")
+    print(f"Concurrent requests: {MAX_WORKERS}")
     print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
 
     # Scrape articles and extract content to MongoDB
-    stats = scrape_et_articles(
-        start_year=START_YEAR,
-        end_year=END_YEAR,
-        use_cache=True,
-        max_workers=MAX_WORKERS,
+    stats = asyncio.run(
+        scrape_et_articles(
+            start_year=START_YEAR,
+            end_year=END_YEAR,
+            use_cache=True,
+            max_workers=MAX_WORKERS,
+        )
     )
 
     # Display results
@@ -5,25 +5,97 @@ This script scrapes article URLs from The Indian Express archive pages.
 Archive URL format: https://indianexpress.com/archive/YYYY/MM/DD/
 """
 
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
-import time
-import random
+import asyncio
+import aiohttp
+import calendar
+from lxml import etree
+from lxml import html as lhtml
 import json
 import os
 import re
+import time
+from html import unescape
 from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
 from pymongo import MongoClient
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
+from pymongo.errors import BulkWriteError
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # Base URL for Indian Express Archive
 BASE_URL = "https://indianexpress.com"
 
+# Compiled once: archive-page anchor hrefs, read straight from the raw bytes.
+# Comments and script/style blocks are matched (and ignored) as a whole so
+# that anchors inside them are skipped, as an HTML parser would skip them
+ARCHIVE_HREF_RE = re.compile(
+    rb"<!--.*?-->|<(script|style)\b.*?</\1\s*>"
+    rb"|<a\s(?:[^>]*?\s)??href\s*=\s*(?:\"([^\"]*)\"|'([^']*)'|([^\s>]+))",
+    re.IGNORECASE | re.DOTALL,
+)
+# Indian Express serves UTF-8; without this libxml2 assumes Latin-1 when a
+# page has no charset declaration
+HTML_PARSER = lhtml.HTMLParser(encoding="utf-8")
+
+
+def has_class(class_name):
+    """XPath predicate matching elements whose class list contains class_name."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+# Compiled once: article-page lookups. Each tuple is tried in order and the
+# first match in document order wins, as the chained find() fallbacks did
+TITLE_XPATHS = (
+    etree.XPath(f"//h1[{has_class('native_story_title')}]"),
+    etree.XPath("//h1"),
+)
+AUTHOR_XPATHS = (
+    etree.XPath(f"//p[{has_class('editor')}]"),
+    etree.XPath(f"//div[{has_class('editor')}]"),
+    etree.XPath("//a[contains(concat(' ', normalize-space(@rel), ' '), ' author ')]"),
+)
+BODY_XPATHS = (
+    etree.XPath(f"//div[{has_class('story_details')}]"),
+    etree.XPath(f"//div[{has_class('full-details')}]"),
+    etree.XPath("//div[@itemprop = 'articleBody']"),
+    etree.XPath("//article"),
+)
+META_XPATH = etree.XPath("//meta[@property]")
+TAG_LINK_XPATH = etree.XPath(f"//a[{has_class('tag')}]")
+JSON_LD_XPATH = etree.XPath("//script[@type = 'application/ld+json']")
+# The first JSON-LD block, found in the raw bytes; when it carries the whole
+# article (JSON_LD_MIN_WORDS or more) the page's DOM is never built
+JSON_LD_BYTES_RE = re.compile(
+    rb"<script[^>]+application/ld\+json[^>]*>(.*?)</script>", re.IGNORECASE | re.DOTALL
+)
+JSON_LD_MIN_WORDS = 50
+# A paragraph's raw string length bounds its stripped text length, so
+# libxml2 drops the short ones before any Python runs
+PARAGRAPH_XPATH = etree.XPath(".//p[string-length() > 20]")
+# Text nodes BeautifulSoup's get_text() counts: not inside script, style,
+# template or ruby annotations (comments are never text nodes)
+VISIBLE_TEXT_XPATH = etree.XPath(
+    "descendant::text()[not(ancestor::script or ancestor::style"
+    " or ancestor::template or ancestor::rt or ancestor::rp)]",
+    smart_strings=False,
+)
+
+# Compiled once: byline prefixes stripped from author names
+AUTHOR_PREFIX_RE = re.compile(r"^(Written by|By|Author:)\s*", re.IGNORECASE)
+# Paragraphs containing any of these phrases are boilerplate, not article text
+SKIP_PARAGRAPH_RE = re.compile(
+    r"advertisement|also read|read more|subscribe now", re.IGNORECASE
+)
+
 # Progress tracking
 CACHE_DIR = "cache_indian_express"
-PROGRESS_FILE = os.path.join(CACHE_DIR, "scraping_progress.json")
+# One completed date per line, appended as each date finishes
+PROGRESS_FILE = os.path.join(CACHE_DIR, "scraping_progress.log")
+# Progress snapshot written by earlier versions; still read when present
+LEGACY_PROGRESS_FILE = os.path.join(CACHE_DIR, "scraping_progress.json")
+# Archive-page validators (ETag / Last-Modified) and the links found, one
+# JSON object per line; later lines for a date supersede earlier ones
+ARCHIVE_CACHE_FILE = os.path.join(CACHE_DIR, "archive_cache.jsonl")
 
 # MongoDB Configuration
 MONGO_URI = "mongodb://localhost:27017/"
@@ -31,46 +103,212 @@ MONGO_DB = "test"
 MONGO_COLLECTION = "articles"
 
 # Parallelization Configuration
-MAX_WORKERS = 5  # Number of concurrent threads for article extraction
+MAX_WORKERS = 20  # Maximum requests in flight at once (across all processes)
+MAX_PROCESSES = os.cpu_count() or 1  # Years scraped in parallel processes
+REQUESTS_PER_SECOND = 5  # Polite crawl rate (across all processes)
+
+# HTTP Configuration
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 3
+
+# Request headers shared by every request on the HTTP session
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Connection": "keep-alive",
+}
+
+
+class RateLimiter:
+    """Token-bucket limiter shared by all coroutines (one token per request)."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self.next_slot = time.monotonic()
+
+    async def acquire(self):
+        """Wait until the caller may issue its next request."""
+        # Slot bookkeeping runs without an await, so no lock is needed
+        now = time.monotonic()
+        slot = max(now, self.next_slot)
+        self.next_slot = slot + self.interval
+        await asyncio.sleep(slot - now)
+
+
+rate_limiter = RateLimiter(REQUESTS_PER_SECOND)
+
+
+async def fetch_html(session, url, **kwargs):
+    """
+    GET a URL, retrying 429/5xx responses with exponential backoff.
+
+    Args:
+        session (aiohttp.ClientSession): Shared HTTP session
+        url (str): URL to fetch
+        **kwargs: Extra arguments for session.get (e.g. headers)
+
+    Returns:
+        tuple: (HTTP status code, response headers, response body bytes)
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        await rate_limiter.acquire()
+        async with session.get(url, timeout=REQUEST_TIMEOUT, **kwargs) as response:
+            if response.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                return response.status, response.headers, await response.read()
+        await asyncio.sleep(0.5 * 2**attempt)
+
+
+def bootstrap_indexes():
+    """Create the collection's indexes; run once before any scraping starts."""
+    client = MongoClient(MONGO_URI)
+    try:
+        # Create index on URL to speed up duplicate checks; being unique, it
+        # also makes insert_articles reject articles that are already stored
+        client[MONGO_DB][MONGO_COLLECTION].create_index("url", unique=True)
+    finally:
+        client.close()
 
 
 # Initialize MongoDB connection
 def get_mongo_collection():
-    """Get MongoDB collection instance."""
+    """Get MongoDB collection instance (indexes come from bootstrap_indexes)."""
     client = MongoClient(MONGO_URI)
     db = client[MONGO_DB]
-    collection = db[MONGO_COLLECTION]
-    # Create index on URL to speed up duplicate checks
-    collection.create_index("url", unique=True)
-    return collection
+    return db[MONGO_COLLECTION]
 
 
-def extract_article_content(url):
+async def extract_article_content(session, url):
     """
-    Extract the full content of an article from Indian Express.
-    Based on logic from scrape_article_content.py
+    Fetch an article from Indian Express and extract its content.
+    Parsing runs in a worker thread so the event loop keeps fetching.
 
     Args:
+        session (aiohttp.ClientSession): Shared HTTP session
         url (str): Article URL
 
     Returns:
         dict: Dictionary containing article content and metadata
     """
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.5",
-        "Connection": "keep-alive",
-    }
+    try:
+        status, _, html = await fetch_html(session, url)
+    except asyncio.TimeoutError:
+        return {"success": False, "url": url, "error": "Timeout"}
+    except aiohttp.ClientError as e:
+        return {"success": False, "url": url, "error": str(e)}
+
+    if status != 200:
+        return {"success": False, "error": f"HTTP {status}"}
+
+    return await asyncio.to_thread(parse_article_content, url, html)
+
+
+def find_first(xpaths, tree):
+    """
+    Return the first element matched by the earliest XPath that matches.
+
+    Args:
+        xpaths (tuple): Compiled XPaths in priority order
+        tree: lxml document to search
+
+    Returns:
+        lxml element or None
+    """
+    for xpath in xpaths:
+        matches = xpath(tree)
+        if matches:
+            return matches[0]
+    return None
 
+
+def element_text(element):
+    """
+    Text of an element the way BeautifulSoup's get_text(strip=True) builds
+    it: every visible text node stripped and joined without a separator.
+    """
+    return "".join(text.strip() for text in VISIBLE_TEXT_XPATH(element))
+
+
+def meta_contents(tree):
+    """
+    Collect every <meta property=...> tag in one pass over the document.
+
+    Args:
+        tree: lxml document to search
+
+    Returns:
+        dict: Maps each property to the content of its first meta tag
+    """
+    metas = {}
+    for meta in META_XPATH(tree):
+        metas.setdefault(meta.get("property"), meta.get("content"))
+    return metas
+
+
+def parse_json_ld_bytes(html):
+    """
+    Decode the page's first JSON-LD block straight from the raw bytes.
+
+    Args:
+        html (bytes): Raw article page
+
+    Returns:
+        dict: JSON-LD object, or None if missing or invalid
+    """
+    match = JSON_LD_BYTES_RE.search(html)
+    if not match:
+        return None
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        data = json.loads(match.group(1))
+    except ValueError:
+        return None
+    if isinstance(data, list):
+        data = data[0] if data else None
+    return data if isinstance(data, dict) else None
+
+
+def apply_json_ld(article_data, data):
+    """
+    Take the article text from a JSON-LD object and fill in the metadata
+    the page itself did not provide.
+
+    Args:
+        article_data (dict): Article fields, updated in place
+        data (dict): JSON-LD object
+    """
+    if "articleBody" in data:
+        article_data["article_text"] = data["articleBody"]
+        article_data["word_count"] = len(article_data["article_text"].split())
+
+    if not article_data["title"] and "headline" in data:
+        article_data["title"] = data["headline"]
+    if not article_data["author"] and "author" in data:
+        if isinstance(data["author"], dict):
+            article_data["author"] = data["author"].get("name")
+        elif isinstance(data["author"], list):
+            article_data["author"] = ", ".join(
+                [a.get("name", "") for a in data["author"]]
+            )
+    if not article_data["published_date"] and "datePublished" in data:
+        article_data["published_date"] = data["datePublished"]
+    if not article_data["modified_date"] and "dateModified" in data:
+        article_data["modified_date"] = data["dateModified"]
 
-        if response.status_code != 200:
-            return {"success": False, "error": f"HTTP {response.status_code}"}
 
-        soup = BeautifulSoup(response.content, "html.parser")
+def parse_article_content(url, html):
+    """
+    Extract the full content of an article from Indian Express.
+    Based on logic from scrape_article_content.py
 
+    Args:
+        url (str): Article URL
+        html (bytes): Raw article page
+
+    Returns:
+        dict: Dictionary containing article content and metadata
+    """
+    try:
         # Initialize result dictionary
         article_data = {
             "success": True,
@@ -86,131 +324,181 @@ def extract_article_content(url):
             "error": None,
         }
 
-        # Extract title
-        title_tag = soup.find("h1", class_="native_story_title")
-        if not title_tag:
-            title_tag = soup.find("h1")
-        if title_tag:
-            article_data["title"] = title_tag.get_text(strip=True)
+        # A blank page has nothing to extract (and lxml refuses to parse it)
+        if not html.strip():
+            return article_data
 
-        # Extract author
-        author_tag = soup.find("p", class_="editor")
-        if not author_tag:
-            author_tag = soup.find("div", class_="editor")
-        if not author_tag:
-            author_tag = soup.find("a", rel="author")
-        if author_tag:
-            author_text = author_tag.get_text(strip=True)
-            author_text = re.sub(
-                r"^(Written by|By|Author:)\s*", "", author_text, flags=re.IGNORECASE
-            )
-            article_data["author"] = author_text
+        # Pages that embed the whole article in JSON-LD need no DOM at all
+        json_ld = parse_json_ld_bytes(html)
+        ld_body = json_ld.get("articleBody") if json_ld else None
+        if isinstance(ld_body, str) and len(ld_body.split()) >= JSON_LD_MIN_WORDS:
+            apply_json_ld(article_data, json_ld)
+            for field, key in (("section", "articleSection"), ("tags", "keywords")):
+                value = json_ld.get(key)
+                if isinstance(value, list):
+                    value = ", ".join(str(item) for item in value)
+                article_data[field] = value
+            return article_data
+
+        tree = lhtml.document_fromstring(html, parser=HTML_PARSER)
 
-        # Extract published date from meta tags
-        date_meta = soup.find("meta", property="article:published_time")
-        if date_meta:
-            article_data["published_date"] = date_meta.get("content")
+        # Extract title
+        title_tag = find_first(TITLE_XPATHS, tree)
+        if title_tag is not None:
+            article_data["title"] = element_text(title_tag)
 
-        # Try modified date
-        modified_meta = soup.find("meta", property="article:modified_time")
-        if modified_meta:
-            article_data["modified_date"] = modified_meta.get("content")
+        # Extract author
+        author_tag = find_first(AUTHOR_XPATHS, tree)
+        if author_tag is not None:
+            author_text = element_text(author_tag)
+            article_data["author"] = AUTHOR_PREFIX_RE.sub("", author_text)
 
-        # Extract section/category
-        section_meta = soup.find("meta", property="article:section")
-        if section_meta:
-            article_data["section"] = section_meta.get("content")
+        # Extract published and modified dates and section from meta tags
+        metas = meta_contents(tree)
+        article_data["published_date"] = metas.get("article:published_time")
+        article_data["modified_date"] = metas.get("article:modified_time")
+        article_data["section"] = metas.get("article:section")
 
         # Extract tags
-        tag_meta = soup.find("meta", property="article:tag")
-        if tag_meta:
-            article_data["tags"] = tag_meta.get("content")
+        if "article:tag" in metas:
+            article_data["tags"] = metas["article:tag"]
         else:
-            tag_elements = soup.find_all("a", class_="tag")
+            tag_elements = TAG_LINK_XPATH(tree)
             if tag_elements:
                 article_data["tags"] = ", ".join(
-                    [tag.get_text(strip=True) for tag in tag_elements]
+                    [element_text(tag) for tag in tag_elements]
                 )
 
         # Extract article text/body
-        article_body = None
-        article_body = soup.find("div", class_="story_details")
-        if not article_body:
-            article_body = soup.find("div", class_="full-details")
-        if not article_body:
-            article_body = soup.find("div", itemprop="articleBody")
-        if not article_body:
-            article_body = soup.find("article")
-
-        if article_body:
-            paragraphs = article_body.find_all("p")
+        article_body = find_first(BODY_XPATHS, tree)
+        if article_body is not None:
             article_text_parts = []
-            for p in paragraphs:
-                text = p.get_text(strip=True)
-                if len(text) > 20:
-                    if not any(
-                        skip_word in text.lower()
-                        for skip_word in [
-                            "advertisement",
-                            "also read",
-                            "read more",
-                            "subscribe now",
-                        ]
-                    ):
-                        article_text_parts.append(text)
+            for p in PARAGRAPH_XPATH(article_body):
+                text = element_text(p)
+                if len(text) > 20 and not SKIP_PARAGRAPH_RE.search(text):
+                    article_text_parts.append(text)
 
             article_data["article_text"] = "\n\n".join(article_text_parts)
             article_data["word_count"] = len(article_data["article_text"].split())
 
         # If no article text found, try JSON-LD data
         if not article_data["article_text"] or article_data["word_count"] < 50:
-            json_ld = soup.find("script", type="application/ld+json")
+            json_ld = JSON_LD_XPATH(tree)
             if json_ld:
                 try:
-                    data = json.loads(json_ld.string)
+                    data = json.loads(json_ld[0].text)
                     if isinstance(data, list):
                         data = data[0]
-
-                    if "articleBody" in data:
-                        article_data["article_text"] = data["articleBody"]
-                        article_data["word_count"] = len(
-                            article_data["article_text"].split()
-                        )
-
-                    if not article_data["title"] and "headline" in data:
-                        article_data["title"] = data["headline"]
-                    if not article_data["author"] and "author" in data:
-                        if isinstance(data["author"], dict):
-                            article_data["author"] = data["author"].get("name")
-                        elif isinstance(data["author"], list):
-                            article_data["author"] = ", ".join(
-                                [a.get("name", "") for a in data["author"]]
-                            )
-                    if not article_data["published_date"] and "datePublished" in data:
-                        article_data["published_date"] = data["datePublished"]
-                    if not article_data["modified_date"] and "dateModified" in data:
-                        article_data["modified_date"] = data["dateModified"]
+                    apply_json_ld(article_data, data)
                 except json.JSONDecodeError:
                     pass
 
         return article_data
 
-    except requests.exceptions.Timeout:
-        return {"success": False, "url": url, "error": "Timeout"}
-    except requests.exceptions.RequestException as e:
-        return {"success": False, "url": url, "error": str(e)}
     except Exception as e:
         return {"success": False, "url": url, "error": str(e)}
 
 
-def scrape_indian_express_articles_for_date(year, month, day):
+def load_archive_cache(start_year, end_year):
+    """
+    Load cached archive-page validators and links for a range of years.
+    Dates outside the range are skipped, so each year worker holds only
+    its own part of the cache.
+
+    Args:
+        start_year (int): Starting year
+        end_year (int): Ending year (inclusive)
+
+    Returns:
+        dict: Maps 'YYYY-MM-DD' to {"etag", "last_modified", "links"}
+    """
+    prefixes = tuple(f"{year}-" for year in range(start_year, end_year + 1))
+    archive_cache = {}
+    if os.path.exists(ARCHIVE_CACHE_FILE):
+        with open(ARCHIVE_CACHE_FILE, "r") as f:
+            for line in f:
+                if line.strip():
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # Partial line from an interrupted append
+                        continue
+                    date_str = entry.pop("date")
+                    if date_str.startswith(prefixes):
+                        archive_cache[date_str] = entry
+    return archive_cache
+
+
+def save_archive_cache_entry(date_str, entry):
+    """Append one date's archive validators and links to the cache file."""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(ARCHIVE_CACHE_FILE, "a") as f:
+        f.write(json.dumps({"date": date_str, **entry}) + "\n")
+
+
+def parse_archive_links(html, date_str):
+    """
+    Extract the unique article links from an archive page.
+
+    Args:
+        html (bytes): Raw archive page
+        date_str (str): Archive date as 'YYYY-MM-DD'
+
+    Returns:
+        list: List of dictionaries containing article information
+    """
+    # Find all article links on the page
+    # Indian Express article URLs follow pattern: /article/...
+    article_links = []
+    seen_links = set()
+    for match in ARCHIVE_HREF_RE.finditer(html):
+        raw_href = match.group(2) or match.group(3) or match.group(4)
+        if not raw_href or b"/article/" not in raw_href:
+            continue
+        href = raw_href.decode("utf-8", "replace")
+        if "&" in href:
+            href = unescape(href)
+
+        # Make full URL if it's a relative path
+        if href.startswith("/"):
+            full_link = BASE_URL + href
+        elif href.startswith("http"):
+            full_link = href
+        else:
+            continue
+
+        # Remove query parameters like ?ref=archive_pg
+        full_link = full_link.split("?")[0]
+
+        # Add to list if not already present
+        if full_link not in seen_links:
+            seen_links.add(full_link)
+            article_links.append(
+                {
+                    "Media Name": "THE INDIAN EXPRESS",
+                    "Article Link": full_link,
+                    "Date": date_str,
+                }
+            )
+    return article_links
+
+
+async def scrape_indian_express_articles_for_date(
+    session, year, month, day, archive_cache=None
+):
     """
     Scrape article links for a specific date from Indian Express archive.
 
+    When archive_cache holds validators for the date, the archive page is
+    requested conditionally; on 304 Not Modified the cached links are reused.
+
     Args:
+        session (aiohttp.ClientSession): Shared HTTP session
         year (int): Year
         month (int): Month (1-12)
         day (int): Day (1-31)
+        archive_cache (dict, optional): Cache from load_archive_cache(),
+            updated in place when the page returns new validators
 
     Returns:
         list: List of dictionaries containing article information
@@ -222,55 +510,49 @@ def scrape_indian_express_articles_for_date(year, month, day):
     url = f"{BASE_URL}/archive/{year}/{month:02d}/{day:02d}/"
     print(f"Scraping URL: {url}")
 
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.5",
-        "Referer": BASE_URL,
-        "Connection": "keep-alive",
-    }
+    headers = {"Referer": BASE_URL}
+    cached = archive_cache.get(date_str) if archive_cache is not None else None
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
 
     try:
-        response = requests.get(url, headers=headers, timeout=30)
-
-        if response.status_code != 200:
-            print(
-                f"Failed to retrieve data from {url} - Status code: {response.status_code}"
-            )
+        status, response_headers, html = await fetch_html(session, url, headers=headers)
+
+        if status == 304 and cached:
+            print(f"Archive unchanged, reusing {len(cached['links'])} cached links")
+            return [
+                {
+                    "Media Name": "THE INDIAN EXPRESS",
+                    "Article Link": link,
+                    "Date": date_str,
+                }
+                for link in cached["links"]
+            ]
+
+        if status != 200:
+            print(f"Failed to retrieve data from {url} - Status code: {status}")
             return []
 
-        soup = BeautifulSoup(response.content, "html.parser")
-
-        # Find all article links on the page
-        # Indian Express article URLs follow pattern: /article/...
+        # Every article href contains "/article/", so pages without it (empty
+        # early archive days) need no parsing at all
         article_links = []
-
-        # Find all <a> tags
-        for link in soup.find_all("a", href=True):
-            href = link["href"]
-
-            # Check if it's an article link (contains /article/)
-            if "/article/" in href:
-                # Make full URL if it's a relative path
-                if href.startswith("/"):
-                    full_link = BASE_URL + href
-                elif href.startswith("http"):
-                    full_link = href
-                else:
-                    continue
-
-                # Remove query parameters like ?ref=archive_pg
-                full_link = full_link.split("?")[0]
-
-                # Add to list if not already present
-                if full_link not in [item["Article Link"] for item in article_links]:
-                    article_links.append(
-                        {
-                            "Media Name": "THE INDIAN EXPRESS",
-                            "Article Link": full_link,
-                            "Date": date_str,
-                        }
-                    )
+        if b"/article/" in html:
+            article_links = await asyncio.to_thread(parse_archive_links, html, date_str)
+
+        # Remember the page's validators for conditional requests next time
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+        if archive_cache is not None and (etag or last_modified):
+            entry = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "links": [item["Article Link"] for item in article_links],
+            }
+            archive_cache[date_str] = entry
+            save_archive_cache_entry(date_str, entry)
 
         print(f"Found {len(article_links)} articles for {date_str}")
         return article_links
@@ -281,57 +563,120 @@ def scrape_indian_express_articles_for_date(year, month, day):
 
 
 def load_progress():
-    """Load scraping progress from cache."""
+    """Load scraping progress from cache, including any legacy JSON snapshot."""
+    progress = {"completed_dates": [], "last_date": None}
+    if os.path.exists(LEGACY_PROGRESS_FILE):
+        with open(LEGACY_PROGRESS_FILE, "r") as f:
+            progress = json.load(f)
     if os.path.exists(PROGRESS_FILE):
         with open(PROGRESS_FILE, "r") as f:
-            return json.load(f)
-    return {"completed_dates": [], "last_date": None}
+            logged_dates = [line.strip() for line in f if line.strip()]
+        if logged_dates:
+            progress["completed_dates"] = list(
+                set(progress["completed_dates"]).union(logged_dates)
+            )
+            progress["last_date"] = logged_dates[-1]
+    return progress
 
 
-def save_progress(completed_dates, last_date):
-    """Save scraping progress to cache."""
+def save_progress(date_str):
+    """Append a completed date to the progress log."""
     os.makedirs(CACHE_DIR, exist_ok=True)
-    progress = {
-        "completed_dates": completed_dates,
-        "last_date": last_date,
-        "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-    }
-    with open(PROGRESS_FILE, "w") as f:
-        json.dump(progress, f, indent=2)
+    with open(PROGRESS_FILE, "a") as f:
+        f.write(date_str + "\n")
 
 
-def process_single_article(article_info, collection, stats_lock):
+def load_known_urls(collection):
     """
-    Process a single article: check for duplicates, extract content, and save to MongoDB.
+    Load every URL already stored in MongoDB into memory.
+    Streams a projection cursor rather than using distinct(), whose single
+    result document is capped at 16 MB.
 
     Args:
-        article_info (dict): Article metadata (URL, date, media name)
         collection: MongoDB collection instance
-        stats_lock (Lock): Thread lock for updating statistics
 
     Returns:
-        dict: Processing result with statistics
+        set: URLs already in the database
+    """
+    return {doc["url"] for doc in collection.find({}, {"url": 1, "_id": 0})}
+
+
+def batch_check_existing_urls(collection, urls, known_urls):
+    """
+    Check which URLs already exist, consulting MongoDB only for URLs that
+    are not in the in-memory set (e.g. ones stored by another process).
+
+    Args:
+        collection: MongoDB collection instance
+        urls (list): List of URLs to check
+        known_urls (set): URLs known to be stored; updated with any found
+
+    Returns:
+        set: Set of URLs that already exist in the database
+    """
+    existing_urls = {url for url in urls if url in known_urls}
+    candidates = [url for url in urls if url not in known_urls]
+    if not candidates:
+        return existing_urls
+
+    # Use $in operator to find all matching URLs in a single query
+    existing_docs = collection.find({"url": {"$in": candidates}}, {"url": 1, "_id": 0})
+    found = {doc["url"] for doc in existing_docs}
+    known_urls.update(found)
+
+    return existing_urls | found
+
+
+def insert_articles(collection, docs):
+    """
+    Insert extracted articles with a single unordered insert_many.
+    The unique URL index rejects articles that are already stored.
+
+    Args:
+        collection: MongoDB collection instance
+        docs (list): Article documents to insert
+
+    Returns:
+        tuple: (inserted count, duplicate count, other error count)
+    """
+    try:
+        result = collection.insert_many(docs, ordered=False)
+        return len(result.inserted_ids), 0, 0
+    except BulkWriteError as bwe:
+        details = bwe.details
+        write_errors = details.get("writeErrors", [])
+        duplicates = sum(1 for err in write_errors if err.get("code") == 11000)
+        return details.get("nInserted", 0), duplicates, len(write_errors) - duplicates
+
+
+async def process_single_article(session, semaphore, article_info):
+    """
+    Process a single article: extract content and build its MongoDB document.
+    Note: Duplicate check is done in batch before the articles are scheduled,
+    and documents are inserted per date (see insert_articles). Nothing is
+    printed here; the caller logs one summary line per date.
+
+    Args:
+        session (aiohttp.ClientSession): Shared HTTP session
+        semaphore (asyncio.Semaphore): Bounds the number of in-flight requests
+        article_info (dict): Article metadata (URL, date, media name)
+
+    Returns:
+        dict: Processing result, with the document to insert on success
     """
     result = {
         "url": article_info["Article Link"],
-        "duplicate": False,
         "success": False,
+        "document": None,
         "error": None,
     }
 
     article_url = article_info["Article Link"]
 
     try:
-        # Check if URL already exists in MongoDB
-        if collection.find_one({"url": article_url}):
-            print(f"  Skipping duplicate: {article_url}")
-            result["duplicate"] = True
-            return result
-
-        print(f"  Extracting content from: {article_url}")
-
-        # Extract article content
-        content = extract_article_content(article_url)
+        async with semaphore:
+            # Extract article content
+            content = await extract_article_content(session, article_url)
 
         if content["success"]:
             # Add metadata from URL scraping
@@ -339,43 +684,50 @@ def process_single_article(article_info, collection, stats_lock):
             content["scrape_date"] = article_info["Date"]
             content["scraped_at"] = datetime.now().isoformat()
 
-            # Insert into MongoDB
-            try:
-                collection.insert_one(content)
-                result["success"] = True
-                print(
-                    f"    ✓ Added to MongoDB - Title: {content.get('title', 'N/A')[:60]}..."
-                )
-                print(f"      Word count: {content.get('word_count', 0)}")
-            except Exception as e:
-                result["error"] = f"MongoDB insert error: {str(e)}"
-                print(f"    ✗ {result['error']}")
+            result["success"] = True
+            result["document"] = content
         else:
             result["error"] = f"Extraction failed: {content.get('error', 'Unknown')}"
-            print(f"    ✗ {result['error']}")
-
-        # Small delay to be respectful to the server
-        time.sleep(random.uniform(1, 2))
 
     except Exception as e:
         result["error"] = str(e)
-        print(f"    ✗ Error processing {article_url}: {str(e)}")
 
     return result
 
 
-def scrape_indian_express_articles(
+def generate_dates(start_year, end_year):
+    """
+    List every date from the start of start_year to the end of end_year.
+
+    Args:
+        start_year (int): Starting year
+        end_year (int): Ending year (inclusive)
+
+    Returns:
+        list: (year, month, day, 'YYYY-MM-DD' string) tuples in date order
+    """
+    return [
+        (year, month, day, f"{year}-{month:02d}-{day:02d}")
+        for year in range(start_year, end_year + 1)
+        for month in range(1, 13)
+        for day in range(1, calendar.monthrange(year, month)[1] + 1)
+    ]
+
+
+async def scrape_indian_express_articles(
     start_year=2020, end_year=2024, use_cache=True, max_workers=MAX_WORKERS
 ):
     """
     Scrape articles for a date range with caching support and MongoDB storage.
-    Uses parallel processing for faster extraction.
+    A month's archive pages are fetched together, then each date's articles
+    are fetched concurrently; all requests share one aiohttp session.
+    Expects the URL index from bootstrap_indexes() to exist.
 
     Args:
         start_year (int): Starting year
         end_year (int): Ending year (inclusive)
         use_cache (bool): Whether to use cache and resume from last position
-        max_workers (int): Number of concurrent threads for article extraction
+        max_workers (int): Maximum number of concurrent requests
 
     Returns:
         dict: Statistics of scraping operation
@@ -390,12 +742,16 @@ def scrape_indian_express_articles(
     if progress["last_date"]:
         print(f"Last scraped date: {progress['last_date']}")
 
-    # Get MongoDB collection
-    collection = get_mongo_collection()
+    # Archive validators are kept even when progress is not, so that
+    # re-scrapes of unchanged dates skip the download
+    archive_cache = load_archive_cache(start_year, end_year)
 
-    # Thread-safe lock for updating statistics
-    stats_lock = Lock()
+    # Get MongoDB collection and the URLs it already holds
+    collection = get_mongo_collection()
+    known_urls = load_known_urls(collection)
+    print(f"Loaded {len(known_urls)} known article URLs from MongoDB")
 
+    # All updates happen on the event loop thread, so no lock is needed
     stats = {
         "total_urls_found": 0,
         "new_articles_added": 0,
@@ -403,92 +759,194 @@ def scrape_indian_express_articles(
         "extraction_failures": 0,
     }
 
-    print(f"\nUsing {max_workers} concurrent threads for article extraction")
-
-    for year in range(start_year, end_year + 1):
-        for month in range(1, 13):
-            # Get the number of days in the month
-            if month in [1, 3, 5, 7, 8, 10, 12]:
-                num_days = 31
-            elif month in [4, 6, 9, 11]:
-                num_days = 30
-            else:  # February
-                num_days = (
-                    29 if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0) else 28
-                )
+    print(f"\nUsing up to {max_workers} concurrent requests")
+
+    async def fetch_listing(session, semaphore, year, month, day):
+        async with semaphore:
+            return await scrape_indian_express_articles_for_date(
+                session, year, month, day, archive_cache
+            )
 
-            for day in range(1, num_days + 1):
-                date_str = f"{year}-{month:02d}-{day:02d}"
+    connector = aiohttp.TCPConnector(limit=max_workers, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=connector, headers=HEADERS) as session:
+        semaphore = asyncio.Semaphore(max_workers)
 
+        all_dates = generate_dates(start_year, end_year)
+        for (year, month), month_dates in groupby(all_dates, key=itemgetter(0, 1)):
+            pending_days = []
+            for _, _, day, date_str in month_dates:
                 # Skip if already scraped
                 if use_cache and date_str in completed_dates:
                     print(f"Skipping {date_str} (already scraped)")
                     continue
+                pending_days.append((day, date_str))
 
+            # Fetch the month's archive pages concurrently
+            listings = await asyncio.gather(
+                *(
+                    fetch_listing(session, semaphore, year, month, day)
+                    for day, _ in pending_days
+                )
+            )
+
+            # Articles are still processed date by date, so a URL listed
+            # on several dates is attributed to the earliest one
+            for (day, date_str), article_urls in zip(pending_days, listings):
                 try:
-                    article_urls = scrape_indian_express_articles_for_date(
-                        year, month, day
-                    )
                     stats["total_urls_found"] += len(article_urls)
 
                     if not article_urls:
                         # No articles found for this date
                         if use_cache:
                             completed_dates.add(date_str)
-                            save_progress(list(completed_dates), date_str)
+                            save_progress(date_str)
                         continue
 
-                    print(
-                        f"  Processing {len(article_urls)} articles with {max_workers} threads..."
+                    # Batch check for existing URLs to avoid duplicate processing
+                    existing_urls = batch_check_existing_urls(
+                        collection,
+                        [a["Article Link"] for a in article_urls],
+                        known_urls,
                     )
-
-                    # Process articles in parallel using ThreadPoolExecutor
-                    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                        # Submit all article processing tasks
-                        future_to_article = {
-                            executor.submit(
-                                process_single_article,
-                                article_info,
-                                collection,
-                                stats_lock,
-                            ): article_info
-                            for article_info in article_urls
-                        }
-
-                        # Process completed tasks
-                        for future in as_completed(future_to_article):
-                            try:
-                                result = future.result()
-
-                                # Update statistics (thread-safe)
-                                with stats_lock:
-                                    if result["duplicate"]:
-                                        stats["duplicates_skipped"] += 1
-                                    elif result["success"]:
-                                        stats["new_articles_added"] += 1
-                                    else:
-                                        stats["extraction_failures"] += 1
-
-                            except Exception as e:
-                                print(f"    ✗ Thread error: {str(e)}")
-                                with stats_lock:
-                                    stats["extraction_failures"] += 1
+                    new_articles = [
+                        article_info
+                        for article_info in article_urls
+                        if article_info["Article Link"] not in existing_urls
+                    ]
+                    duplicates_found = len(article_urls) - len(new_articles)
+
+                    # Process the date's articles concurrently
+                    results = await asyncio.gather(
+                        *(
+                            process_single_article(session, semaphore, article_info)
+                            for article_info in new_articles
+                        ),
+                        return_exceptions=True,
+                    )
+                    documents = [
+                        result["document"]
+                        for result in results
+                        if isinstance(result, dict) and result["success"]
+                    ]
+                    failures = len(results) - len(documents)
+
+                    # Insert the date's articles into MongoDB in one round trip
+                    inserted, duplicates, errors = 0, 0, 0
+                    if documents:
+                        try:
+                            inserted, duplicates, errors = insert_articles(
+                                collection, documents
+                            )
+                        except Exception as e:
+                            print(f"  ✗ MongoDB insert error: {str(e)}")
+                            inserted, duplicates, errors = 0, 0, len(documents)
+                        if not errors:
+                            # Every URL of the date is now stored
+                            known_urls.update(doc["url"] for doc in documents)
 
                     # Mark date as completed
                     if use_cache:
                         completed_dates.add(date_str)
-                        save_progress(list(completed_dates), date_str)
+                        save_progress(date_str)
 
+                    stats["new_articles_added"] += inserted
+                    stats["duplicates_skipped"] += duplicates_found + duplicates
+                    stats["extraction_failures"] += failures + errors
                     print(
-                        f"  Completed {date_str} - Added: {stats['new_articles_added']}, Duplicates: {stats['duplicates_skipped']}, Failures: {stats['extraction_failures']}"
+                        f"  Completed {date_str} - Found: {len(article_urls)}, Added: {inserted}, "
+                        f"Duplicates: {duplicates_found + duplicates}, Failures: {failures + errors}"
                     )
 
                 except Exception as e:
                     print(f"Error on {date_str}: {e}")
-                    continue
 
-                # Random delay between dates
-                time.sleep(random.uniform(1, 2))
+    return stats
+
+
+def scrape_year(year, use_cache, max_workers, requests_per_second):
+    """
+    Scrape a single year on its own event loop. Worker entry point for
+    scrape_indian_express_parallel; each process opens its own MongoClient
+    and HTTP session and paces its requests with its own rate limiter.
+
+    Args:
+        year (int): Year to scrape
+        use_cache (bool): Whether to use cache and resume from last position
+        max_workers (int): Maximum number of concurrent requests
+        requests_per_second (float): This process's share of the crawl rate
+
+    Returns:
+        dict: Statistics of scraping operation
+    """
+    global rate_limiter
+    rate_limiter = RateLimiter(requests_per_second)
+    return asyncio.run(
+        scrape_indian_express_articles(
+            start_year=year, end_year=year, use_cache=use_cache, max_workers=max_workers
+        )
+    )
+
+
+def scrape_indian_express_parallel(
+    start_year=2020,
+    end_year=2024,
+    use_cache=True,
+    max_workers=MAX_WORKERS,
+    max_processes=MAX_PROCESSES,
+):
+    """
+    Scrape a date range with one worker process per year, so article parsing
+    runs on several cores. The max_workers request budget and the
+    REQUESTS_PER_SECOND rate are split between the processes, keeping the
+    crawl as polite as a single process.
+
+    Args:
+        start_year (int): Starting year
+        end_year (int): Ending year (inclusive)
+        use_cache (bool): Whether to use cache and resume from last position
+        max_workers (int): Maximum number of concurrent requests in total
+        max_processes (int): Maximum number of worker processes
+
+    Returns:
+        dict: Statistics summed over all years
+    """
+    years = list(range(start_year, end_year + 1))
+    # At most one process per request slot, so the budget split below never
+    # rounds a process up to more requests than max_workers allows in total
+    processes = max(1, min(max_processes, len(years), max_workers))
+    workers_per_process = max(1, max_workers // processes)
+    rate_per_process = REQUESTS_PER_SECOND / processes
+
+    # Indexes are created once here rather than by every worker
+    bootstrap_indexes()
+    print(
+        f"Scraping {len(years)} years in {processes} processes "
+        f"with {workers_per_process} concurrent requests each"
+    )
+
+    stats = {
+        "total_urls_found": 0,
+        "new_articles_added": 0,
+        "duplicates_skipped": 0,
+        "extraction_failures": 0,
+    }
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        future_to_year = {
+            executor.submit(
+                scrape_year, year, use_cache, workers_per_process, rate_per_process
+            ): year
+            for year in years
+        }
+        for future in as_completed(future_to_year):
+            year = future_to_year[future]
+            try:
+                year_stats = future.result()
+            except Exception as e:
+                print(f"Error scraping {year}: {e}")
+                continue
+            for key, value in year_stats.items():
+                stats[key] += value
+            print(f"Finished {year}: {year_stats}")
 
     return stats
 
@@ -507,7 +965,7 @@ def main():
     print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
 
     # Scrape articles and extract content to MongoDB
-    stats = scrape_indian_express_articles(
+    stats = scrape_indian_express_parallel(
         start_year=START_YEAR, end_year=END_YEAR, use_cache=True
     )
 
@@ -6,17 +6,18 @@ API URL format: https://api.jagran.com/api/jagran/articlesbycatsubcat/news/natio
 Article URL format: https://www.jagran.com/news/national-{webTitleUrl}-{id}.html
 """
 
-import requests
-from bs4 import BeautifulSoup
-import time
-import random
+import asyncio
+import aiohttp
+from lxml import etree
+from lxml import html as lhtml
 import json
+import orjson
 import os
 import re
-from datetime import datetime
+import time
+from datetime import date, datetime
 from pymongo import MongoClient
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
+from pymongo.errors import BulkWriteError
 
 # Base URLs
 BASE_URL = "https://www.jagran.com"
@@ -25,6 +26,91 @@ API_BASE_URL = "https://api.jagran.com/api/jagran/articlesbycatsubcat"
 # API Authorization Token (from user's curl)
 API_TOKEN = ""
 
+# Jagran serves UTF-8; without this libxml2 assumes Latin-1 when a page has
+# no charset declaration
+HTML_PARSER = lhtml.HTMLParser(encoding="utf-8")
+
+
+def has_class(class_name):
+    """XPath predicate matching elements whose class list contains class_name."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+def lower_class_contains(*keywords):
+    """XPath predicate matching elements whose lowercased class contains any keyword."""
+    lowered = (
+        "translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+    )
+    return " or ".join(f"contains({lowered}, '{keyword}')" for keyword in keywords)
+
+
+# Compiled once: article-page lookups
+TITLE_XPATH = etree.XPath("//h1")
+AUTHOR_XPATH = etree.XPath("//a[contains(@href, '/author/')]")
+TIME_XPATH = etree.XPath("//time")
+META_XPATH = etree.XPath("//meta[@property]")
+KEYWORDS_XPATH = etree.XPath("//meta[@name = 'keywords']")
+JSON_LD_XPATH = etree.XPath("//script[@type = 'application/ld+json']")
+# Article containers in priority order; within each, the first match in
+# document order wins, as the chained find() fallbacks did
+BODY_XPATHS = (
+    etree.XPath(f"//div[{has_class('articleBody')}]"),
+    etree.XPath(f"//div[{has_class('article-content')}]"),
+    etree.XPath(f"//div[{has_class('story-content')}]"),
+    etree.XPath("//article"),
+    etree.XPath(f"//div[{lower_class_contains('content', 'article', 'story')}]"),
+    etree.XPath("//main"),
+    etree.XPath("//body"),
+)
+# Class substrings (case-insensitive) marking ads and social widgets
+AD_CLASS_KEYWORDS = ("ad", "advertisement", "promo", "social", "share", "related")
+# Elements stripped from the article body before its text is read: page
+# furniture and embeds, plus ad and social blocks, in one tree walk
+UNWANTED_XPATH = etree.XPath(
+    ".//*[self::script or self::style or self::nav or self::header"
+    " or self::footer or self::aside or self::iframe or self::noscript"
+    f" or {lower_class_contains(*AD_CLASS_KEYWORDS)}]"
+)
+# Paragraphs and list items in document order. A node's raw string length
+# bounds its stripped text length, so libxml2 drops the short ones before
+# any Python runs
+PARAGRAPH_XPATH = etree.XPath(".//*[self::p or self::li][string-length() > 15]")
+# Compiled once: boilerplate phrases (matched against lowercased text).
+# Paragraphs containing any of them are skipped, as are fallback lines,
+# which also skip the "more news" footer
+SKIP_PHRASES = (
+    "advertisement",
+    "also read",
+    "read more",
+    "subscribe",
+    "follow us",
+    "download app",
+    "ये भी पढ़ें",
+    "यह भी पढ़ें",
+    "इसे भी पढ़ें",
+)
+SKIP_PARAGRAPH_RE = re.compile("|".join(map(re.escape, SKIP_PHRASES)))
+SKIP_LINE_RE = re.compile("|".join(map(re.escape, SKIP_PHRASES + ("खबरें और भी",))))
+# Dateline and byline lines dropped by the line-based fallback
+META_LINE_RE = re.compile("Updated:|Published:|Written by|Edited by")
+# Text nodes BeautifulSoup's get_text() counts: not inside script, style,
+# template or ruby annotations (comments are never text nodes)
+VISIBLE_TEXT_XPATH = etree.XPath(
+    "descendant::text()[not(ancestor::script or ancestor::style"
+    " or ancestor::template or ancestor::rt or ancestor::rp)]",
+    smart_strings=False,
+)
+
+# Compiled once: the usual Jagran date shape, e.g.
+# 'Sun, 30 Nov 2025 07:25 PM (IST)' (weekday optional, '(IST)' or 'IST')
+JAGRAN_DATE_RE = re.compile(
+    r"(?:(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun), )?(\d{1,2})"
+    r" (Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec) (\d{4})"
+    r" (?:1[0-2]|0?[1-9]):[0-5]\d [AP]M (?:\(IST\)|IST)"
+)
+MONTH_ABBREVIATIONS = "Jan Feb Mar Apr May Jun Jul Aug Sep Oct Nov Dec".split()
+MONTH_NUMBERS = {name: number for number, name in enumerate(MONTH_ABBREVIATIONS, 1)}
+
 # Progress tracking
 CACHE_DIR = "cache_jagran"
 PROGRESS_FILE = os.path.join(CACHE_DIR, "scraping_progress.json")
@@ -35,24 +121,60 @@ MONGO_DB = "test"
 MONGO_COLLECTION = "articles"
 
 # Parallelization Configuration
-MAX_WORKERS = 5  # Number of concurrent threads for article extraction
+MAX_WORKERS = 5  # Maximum article requests in flight at once
+REQUESTS_PER_SECOND = 5  # Polite crawl rate (API and article requests)
+
+# HTTP Configuration
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 2
+# Compressed encodings aiohttp decodes without optional packages (br and
+# zstd need Brotli/zstandard, which are not dependencies)
+ACCEPT_ENCODING = "gzip, deflate"
+
+
+class RateLimiter:
+    """Token-bucket limiter shared by all coroutines (one token per request)."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self.next_slot = time.monotonic()
+
+    async def acquire(self):
+        """Wait until the caller may issue its next request."""
+        # Slot bookkeeping runs without an await, so no lock is needed
+        now = time.monotonic()
+        slot = max(now, self.next_slot)
+        self.next_slot = slot + self.interval
+        await asyncio.sleep(slot - now)
+
+
+rate_limiter = RateLimiter(REQUESTS_PER_SECOND)
+
+# Shared MongoDB client, created on first use; it pools its own connections
+mongo_client = None
 
 
 # Initialize MongoDB connection
 def get_mongo_collection():
-    """Get MongoDB collection instance."""
-    client = MongoClient(MONGO_URI)
-    db = client[MONGO_DB]
-    collection = db[MONGO_COLLECTION]
-    # Create index on URL to speed up duplicate checks
-    collection.create_index("url", unique=True)
-    return collection
+    """
+    Get MongoDB collection instance. The first call creates the shared
+    client and the URL index; later calls reuse both.
+    """
+    global mongo_client
+    if mongo_client is None:
+        mongo_client = MongoClient(MONGO_URI)
+        # Create index on URL to speed up duplicate checks; being unique, it
+        # also makes insert_articles reject articles that are already stored
+        mongo_client[MONGO_DB][MONGO_COLLECTION].create_index("url", unique=True)
+    return mongo_client[MONGO_DB][MONGO_COLLECTION]
 
 
 def get_api_headers():
     """Get headers for API requests."""
     return {
         "Accept": "*/*",
+        "Accept-Encoding": ACCEPT_ENCODING,
         "Accept-Language": "en-GB,en-US;q=0.9,en;q=0.8",
         "Authorization": f"Bearer {API_TOKEN}",
         "Connection": "keep-alive",
@@ -70,6 +192,7 @@ def get_web_headers():
     return {
         "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36",
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+        "Accept-Encoding": ACCEPT_ENCODING,
         "Accept-Language": "en-US,en;q=0.5,hi;q=0.3",
         "Connection": "keep-alive",
     }
@@ -104,7 +227,17 @@ def normalize_published_date(raw_date):
 
     text = str(raw_date).strip()
 
-    # Try ISO / ISO-like formats first
+    # Fast path for the usual Jagran shape; anything else (or an impossible
+    # date) goes through the parsers below
+    match = JAGRAN_DATE_RE.fullmatch(text)
+    if match:
+        day, month, year = match.groups()
+        try:
+            return date(int(year), MONTH_NUMBERS[month], int(day)).isoformat()
+        except ValueError:
+            pass
+
+    # Try ISO / ISO-like formats
     try:
         iso_candidate = text
         # Handle '2025-11-30 19:25:00+05:30' -> '2025-11-30T19:25:00+05:30'
@@ -150,11 +283,34 @@ def normalize_published_date(raw_date):
     return text
 
 
-def extract_article_content(url):
+async def fetch_html(session, url, **kwargs):
+    """
+    GET a URL on the shared session, retrying 429/5xx responses with
+    exponential backoff.
+
+    Args:
+        session (aiohttp.ClientSession): Shared HTTP session
+        url (str): URL to fetch
+        **kwargs: Extra arguments for session.get (e.g. headers)
+
+    Returns:
+        tuple: (HTTP status code, response body bytes)
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        await rate_limiter.acquire()
+        async with session.get(url, timeout=REQUEST_TIMEOUT, **kwargs) as response:
+            if response.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                return response.status, await response.read()
+        await asyncio.sleep(0.5 * 2**attempt)
+
+
+async def extract_article_content(session, url):
     """
-    Extract the full content of an article from Jagran.
+    Fetch an article from Jagran and extract its content.
+    Parsing runs in a worker thread so the event loop keeps fetching.
 
     Args:
+        session (aiohttp.ClientSession): Shared HTTP session
         url (str): Article URL
 
     Returns:
@@ -163,13 +319,79 @@ def extract_article_content(url):
     headers = get_web_headers()
 
     try:
-        response = requests.get(url, headers=headers, timeout=30)
+        status, html = await fetch_html(session, url, headers=headers)
+        if status != 200:
+            return {"success": False, "error": f"HTTP {status}"}
+
+    except asyncio.TimeoutError:
+        return {"success": False, "url": url, "error": "Timeout"}
+    except aiohttp.ClientError as e:
+        return {"success": False, "url": url, "error": str(e)}
+
+    return await asyncio.to_thread(parse_article_content, url, html)
+
+
+def find_first(xpaths, tree):
+    """
+    Return the first element matched by the earliest XPath that matches.
+
+    Args:
+        xpaths (tuple): Compiled XPaths in priority order
+        tree: lxml document to search
+
+    Returns:
+        lxml element or None
+    """
+    for xpath in xpaths:
+        matches = xpath(tree)
+        if matches:
+            return matches[0]
+    return None
+
+
+def element_strings(element):
+    """
+    Visible text nodes of an element, stripped, with the empty ones dropped
+    (BeautifulSoup's stripped_strings).
+    """
+    return [
+        text for text in (node.strip() for node in VISIBLE_TEXT_XPATH(element)) if text
+    ]
+
+
+def element_text(element):
+    """Text of an element the way BeautifulSoup's get_text(strip=True) builds it."""
+    return "".join(element_strings(element))
+
+
+def meta_contents(tree):
+    """
+    Collect every <meta property=...> tag in one pass over the document.
+
+    Args:
+        tree: lxml document to search
+
+    Returns:
+        dict: Maps each property to the content of its first meta tag
+    """
+    metas = {}
+    for meta in META_XPATH(tree):
+        metas.setdefault(meta.get("property"), meta.get("content"))
+    return metas
+
 
-        if response.status_code != 200:
-            return {"success": False, "error": f"HTTP {response.status_code}"}
+def parse_article_content(url, html):
+    """
+    Extract the full content of an article page from Jagran.
 
-        soup = BeautifulSoup(response.content, "html.parser")
+    Args:
+        url (str): Article URL
+        html (bytes): Raw article page
 
+    Returns:
+        dict: Dictionary containing article content and metadata
+    """
+    try:
         # Initialize result dictionary
         article_data = {
             "success": True,
@@ -185,135 +407,78 @@ def extract_article_content(url):
             "error": None,
         }
 
+        # A blank page has nothing to extract (and lxml refuses to parse it)
+        if not html.strip():
+            return article_data
+
+        tree = lhtml.document_fromstring(html, parser=HTML_PARSER)
+
         # Extract title from h1 tag
-        title_tag = soup.find("h1")
-        if title_tag:
-            article_data["title"] = title_tag.get_text(strip=True)
+        title_tags = TITLE_XPATH(tree)
+        if title_tags:
+            article_data["title"] = element_text(title_tags[0])
 
         # Extract author from author link
-        author_link = soup.find("a", href=re.compile(r"/author/"))
-        if author_link:
-            article_data["author"] = author_link.get_text(strip=True)
+        author_links = AUTHOR_XPATH(tree)
+        if author_links:
+            article_data["author"] = element_text(author_links[0])
+
+        metas = meta_contents(tree)
 
         # Extract published date from meta tags
-        date_meta = soup.find("meta", property="article:published_time")
-        if date_meta:
+        if "article:published_time" in metas:
             article_data["published_date"] = normalize_published_date(
-                date_meta.get("content")
+                metas["article:published_time"]
             )
         else:
             # Try to find date in page content
-            time_tag = soup.find("time")
-            if time_tag:
-                raw_time = time_tag.get("datetime") or time_tag.get_text(strip=True)
+            time_tags = TIME_XPATH(tree)
+            if time_tags:
+                raw_time = time_tags[0].get("datetime") or element_text(time_tags[0])
                 article_data["published_date"] = normalize_published_date(raw_time)
 
         # Try modified date
-        modified_meta = soup.find("meta", property="article:modified_time")
-        if modified_meta:
-            article_data["modified_date"] = modified_meta.get("content")
-
-        # Extract section/category
-        section_meta = soup.find("meta", property="article:section")
-        if section_meta:
-            article_data["section"] = section_meta.get("content")
+        article_data["modified_date"] = metas.get("article:modified_time")
+
+        # Extract section/category (default to national news)
+        if "article:section" in metas:
+            article_data["section"] = metas["article:section"]
         else:
-            # Default to national news
             article_data["section"] = "National"
 
         # Extract tags/keywords
-        keywords_meta = soup.find("meta", attrs={"name": "keywords"})
-        if keywords_meta:
-            article_data["tags"] = keywords_meta.get("content")
+        keywords_metas = KEYWORDS_XPATH(tree)
+        if keywords_metas:
+            article_data["tags"] = keywords_metas[0].get("content")
         else:
-            tag_meta = soup.find("meta", property="article:tag")
-            if tag_meta:
-                article_data["tags"] = tag_meta.get("content")
-
-        # Extract article text/body
-        article_body = None
-
-        # Try different selectors for Jagran article content
-        article_body = soup.find("div", class_="articleBody")
-        if not article_body:
-            article_body = soup.find("div", class_="article-content")
-        if not article_body:
-            article_body = soup.find("div", class_="story-content")
-        if not article_body:
-            article_body = soup.find("article")
-        if not article_body:
-            # Fallback: find main content area
-            article_body = soup.find(
-                "div", class_=re.compile(r"content|article|story", re.I)
-            )
+            article_data["tags"] = metas.get("article:tag")
 
-        # As a last resort, fall back to <main> or <body>
-        if article_body is None:
-            main_tag = soup.find("main")
-            article_body = main_tag if main_tag is not None else soup.body
-
-        if article_body:
-            # Remove unwanted elements
-            for element in article_body.find_all(
-                [
-                    "script",
-                    "style",
-                    "nav",
-                    "header",
-                    "footer",
-                    "aside",
-                    "iframe",
-                    "noscript",
-                ]
-            ):
-                element.decompose()
-
-            # Remove ads and social elements
-            for element in article_body.find_all(
-                class_=lambda x: x
-                and any(
-                    keyword in str(x).lower()
-                    for keyword in [
-                        "ad",
-                        "advertisement",
-                        "promo",
-                        "social",
-                        "share",
-                        "related",
-                    ]
-                )
-            ):
-                element.decompose()
+        # Extract article text/body, trying the Jagran content containers
+        # before falling back to <main> or <body>
+        article_body = find_first(BODY_XPATHS, tree)
+
+        if article_body is not None:
+            # Remove unwanted elements, ads and social elements. Clearing
+            # (rather than dropping) keeps the text either side of each one
+            # a separate string, as BeautifulSoup's decompose() did
+            for element in UNWANTED_XPATH(article_body):
+                element.clear(keep_tail=True)
 
             # Extract paragraphs and list items first
             article_text_parts = []
-            for tag_name in ["p", "li"]:
-                for node in article_body.find_all(tag_name):
-                    text = node.get_text(strip=True)
-                    if len(text) <= 15:
-                        continue
-                    # Skip common unwanted phrases
-                    if any(
-                        skip_word in text.lower()
-                        for skip_word in [
-                            "advertisement",
-                            "also read",
-                            "read more",
-                            "subscribe",
-                            "follow us",
-                            "download app",
-                            "ये भी पढ़ें",
-                            "यह भी पढ़ें",
-                            "इसे भी पढ़ें",
-                        ]
-                    ):
-                        continue
-                    article_text_parts.append(text)
+            for node in PARAGRAPH_XPATH(article_body):
+                text = element_text(node)
+                if len(text) <= 15:
+                    continue
+                # Skip common unwanted phrases
+                if SKIP_PARAGRAPH_RE.search(text.lower()):
+                    continue
+                article_text_parts.append(text)
 
             # If word count still looks too small, fall back to line-based extraction
             base_word_count = len(" ".join(article_text_parts).split())
             if base_word_count < 80:
-                full_text = article_body.get_text("\n", strip=True)
+                full_text = "\n".join(element_strings(article_body))
                 for line in full_text.split("\n"):
                     line = line.strip()
                     if not line:
@@ -321,53 +486,26 @@ def extract_article_content(url):
                     # Skip title and very short/meta lines
                     if article_data["title"] and line == article_data["title"]:
                         continue
-                    if any(
-                        prefix in line
-                        for prefix in [
-                            "Updated:",
-                            "Published:",
-                            "Written by",
-                            "Edited by",
-                        ]
-                    ):
+                    if META_LINE_RE.search(line):
                         continue
-                    if any(
-                        skip_word in line.lower()
-                        for skip_word in [
-                            "advertisement",
-                            "also read",
-                            "read more",
-                            "subscribe",
-                            "follow us",
-                            "download app",
-                            "ये भी पढ़ें",
-                            "यह भी पढ़ें",
-                            "इसे भी पढ़ें",
-                            "खबरें और भी",
-                        ]
-                    ):
+                    if SKIP_LINE_RE.search(line.lower()):
                         continue
                     if len(line.split()) < 4:
                         continue
                     article_text_parts.append(line)
 
             # De-duplicate while preserving order
-            seen_lines = set()
-            deduped_parts = []
-            for line in article_text_parts:
-                if line not in seen_lines:
-                    seen_lines.add(line)
-                    deduped_parts.append(line)
+            deduped_parts = list(dict.fromkeys(article_text_parts))
 
             article_data["article_text"] = "\n\n".join(deduped_parts)
             article_data["word_count"] = len(article_data["article_text"].split())
 
         # If no article text found, try JSON-LD data
         if not article_data["article_text"] or article_data["word_count"] < 30:
-            json_ld_scripts = soup.find_all("script", type="application/ld+json")
+            json_ld_scripts = JSON_LD_XPATH(tree)
             for json_ld in json_ld_scripts:
                 try:
-                    data = json.loads(json_ld.string)
+                    data = orjson.loads(json_ld.text or b"")
                     if isinstance(data, list):
                         data = data[0]
                     if isinstance(data, dict):
@@ -402,26 +540,23 @@ def extract_article_content(url):
 
                         if article_data["article_text"]:
                             break
-                except (json.JSONDecodeError, TypeError):
+                except (orjson.JSONDecodeError, TypeError):
                     pass
 
         return article_data
 
-    except requests.exceptions.Timeout:
-        return {"success": False, "url": url, "error": "Timeout"}
-    except requests.exceptions.RequestException as e:
-        return {"success": False, "url": url, "error": str(e)}
     except Exception as e:
         return {"success": False, "url": url, "error": str(e)}
 
 
-def fetch_articles_from_api(
-    page_number, count=10, category="news", subcategory="national"
+async def fetch_articles_from_api(
+    session, page_number, count=10, category="news", subcategory="national"
 ):
     """
     Fetch article list from Jagran API for a specific page.
 
     Args:
+        session (aiohttp.ClientSession): Shared HTTP session
         page_number (int): Page number to fetch
         count (int): Number of articles per page
         category (str): Category (default: news)
@@ -436,13 +571,11 @@ def fetch_articles_from_api(
     headers = get_api_headers()
 
     try:
-        response = requests.get(url, headers=headers, timeout=30)
-
-        if response.status_code != 200:
-            print(f"API request failed - Status code: {response.status_code}")
+        status, body = await fetch_html(session, url, headers=headers)
+        if status != 200:
+            print(f"API request failed - Status code: {status}")
             return None
-
-        data = response.json()
+        data = orjson.loads(body)
 
         if not data or not isinstance(data, list):
             print(f"Empty or invalid API response on page {page_number}")
@@ -475,13 +608,13 @@ def fetch_articles_from_api(
         print(f"Found {len(articles)} articles on page {page_number}")
         return articles
 
-    except requests.exceptions.Timeout:
+    except asyncio.TimeoutError:
         print(f"API request timeout on page {page_number}")
         return None
-    except requests.exceptions.RequestException as e:
+    except aiohttp.ClientError as e:
         print(f"API request error on page {page_number}: {str(e)}")
         return None
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         print(f"JSON decode error on page {page_number}: {str(e)}")
         return None
     except Exception as e:
@@ -510,54 +643,98 @@ def save_progress(completed_pages, last_page, total_articles):
         json.dump(progress, f, indent=2)
 
 
-def batch_check_existing_urls(collection, urls):
+def load_known_urls(collection):
     """
-    Check which URLs already exist in MongoDB using a single batch query.
+    Load every URL already stored in MongoDB into memory.
+    Streams a projection cursor rather than using distinct(), whose single
+    result document is capped at 16 MB.
+
+    Args:
+        collection: MongoDB collection instance
+
+    Returns:
+        set: URLs already in the database
+    """
+    return {doc["url"] for doc in collection.find({}, {"url": 1, "_id": 0})}
+
+
+def batch_check_existing_urls(collection, urls, known_urls):
+    """
+    Check which URLs already exist, consulting MongoDB only for URLs that
+    are not in the in-memory set (e.g. ones stored by another run).
 
     Args:
         collection: MongoDB collection instance
         urls (list): List of URLs to check
+        known_urls (set): URLs known to be stored; updated with any found
 
     Returns:
         set: Set of URLs that already exist in the database
     """
-    if not urls:
-        return set()
+    existing_urls = {url for url in urls if url in known_urls}
+    candidates = [url for url in urls if url not in known_urls]
+    if not candidates:
+        return existing_urls
 
-    existing_docs = collection.find({"url": {"$in": urls}}, {"url": 1})
-    existing_urls = {doc["url"] for doc in existing_docs}
+    # Project out _id so the query is covered by the unique url index
+    existing_docs = collection.find({"url": {"$in": candidates}}, {"url": 1, "_id": 0})
+    found = {doc["url"] for doc in existing_docs}
+    known_urls.update(found)
 
-    return existing_urls
+    return existing_urls | found
 
 
-def process_single_article(article_info, collection, stats_lock, stats):
+def insert_articles(collection, docs):
     """
-    Process a single article: extract content and save to MongoDB.
-    Thread-safe function for parallel processing.
+    Insert extracted articles with a single unordered insert_many.
+    The unique URL index rejects articles that are already stored.
 
     Args:
-        article_info (dict): Article metadata from API
         collection: MongoDB collection instance
-        stats_lock (Lock): Thread lock for updating statistics
+        docs (list): Article documents to insert
+
+    Returns:
+        tuple: (inserted count, duplicate count, other error count)
+    """
+    try:
+        result = collection.insert_many(docs, ordered=False)
+        return len(result.inserted_ids), 0, 0
+    except BulkWriteError as bwe:
+        details = bwe.details
+        write_errors = details.get("writeErrors", [])
+        duplicates = sum(1 for err in write_errors if err.get("code") == 11000)
+        return details.get("nInserted", 0), duplicates, len(write_errors) - duplicates
+
+
+async def process_single_article(session, semaphore, article_info, stats):
+    """
+    Process a single article: extract content and build its MongoDB document.
+    Documents are inserted per page (see insert_articles). Runs on the event
+    loop, so stats are updated without a lock.
+
+    Args:
+        session (aiohttp.ClientSession): Shared HTTP session
+        semaphore (asyncio.Semaphore): Bounds the number of in-flight requests
+        article_info (dict): Article metadata from API
         stats (dict): Statistics dictionary
 
     Returns:
-        tuple: (success, message)
+        tuple: (document to insert or None, message)
     """
     article_url = article_info["Article Link"]
 
     try:
-        print(f"  Extracting content from: {article_url}")
+        async with semaphore:
+            print(f"  Extracting content from: {article_url}")
 
-        # Extract article content from web page
-        content = extract_article_content(article_url)
+            # Extract article content from web page
+            content = await extract_article_content(session, article_url)
 
         if content["success"]:
             # Skip if word count is zero
             if content.get("word_count", 0) == 0:
-                with stats_lock:
-                    stats["zero_word_count_skipped"] += 1
-                return (False, f"    ⚠ Skipping - Zero word count")
+                stats["zero_word_count_skipped"] += 1
+                return (None, f"    ⚠ Skipping - Zero word count")
 
             # Add metadata from API response
             content["media_name"] = article_info["Media Name"]
@@ -575,38 +752,25 @@ def process_single_article(article_info, collection, stats_lock, stats):
                     article_info["ModDate"]
                 )
 
-            # Insert into MongoDB
-            try:
-                collection.insert_one(content)
-                with stats_lock:
-                    stats["new_articles_added"] += 1
-
-                title_preview = content.get("title", "N/A")[:50]
-                word_count = content.get("word_count", 0)
-                return (True, f"    ✓ Added - {title_preview}... ({word_count} words)")
-            except Exception as e:
-                if "duplicate key" in str(e).lower():
-                    with stats_lock:
-                        stats["duplicates_skipped"] += 1
-                    return (False, f"    ⚠ Duplicate URL skipped")
-                with stats_lock:
-                    stats["extraction_failures"] += 1
-                return (False, f"    ✗ MongoDB error: {str(e)}")
+            title_preview = (content.get("title") or "N/A")[:50]
+            word_count = content.get("word_count", 0)
+            return (
+                content,
+                f"    ✓ Extracted - {title_preview}... ({word_count} words)",
+            )
         else:
-            with stats_lock:
-                stats["extraction_failures"] += 1
+            stats["extraction_failures"] += 1
             return (
-                False,
+                None,
                 f"    ✗ Extraction failed: {content.get('error', 'Unknown')}",
             )
 
     except Exception as e:
-        with stats_lock:
-            stats["extraction_failures"] += 1
-        return (False, f"    ✗ Exception: {str(e)}")
+        stats["extraction_failures"] += 1
+        return (None, f"    ✗ Exception: {str(e)}")
 
 
-def scrape_jagran_articles(
+async def scrape_jagran_articles(
     start_page=1,
     end_page=None,
     articles_per_page=10,
@@ -615,14 +779,15 @@ def scrape_jagran_articles(
 ):
     """
     Scrape articles from Jagran national news using their API.
-    Uses parallel processing for article extraction.
+    Each page's articles are fetched concurrently; all requests share one
+    aiohttp session.
 
     Args:
         start_page (int): Starting page number
         end_page (int): Ending page number (None for auto-detect)
         articles_per_page (int): Number of articles per API call
         use_cache (bool): Whether to use cache and resume from last position
-        max_workers (int): Maximum number of parallel workers
+        max_workers (int): Maximum number of concurrent article requests
 
     Returns:
         dict: Statistics of scraping operation
@@ -642,14 +807,14 @@ def scrape_jagran_articles(
     print(f"\nCache status: {len(completed_pages)} pages already scraped")
     if progress["last_page"]:
         print(f"Last scraped page: {progress['last_page']}")
-    print(f"Using {max_workers} parallel workers for article extraction\n")
+    print(f"Using up to {max_workers} concurrent requests for article extraction\n")
 
-    # Get MongoDB collection
+    # Get MongoDB collection and the URLs it already holds
     collection = get_mongo_collection()
+    known_urls = load_known_urls(collection)
+    print(f"Loaded {len(known_urls)} known article URLs from MongoDB")
 
-    # Thread lock for stats updates
-    stats_lock = Lock()
-
+    # All updates happen on the event loop thread, so no lock is needed
     stats = {
         "total_urls_found": 0,
         "new_articles_added": 0,
@@ -658,124 +823,143 @@ def scrape_jagran_articles(
         "extraction_failures": 0,
     }
 
-    current_page = start_page
-    consecutive_empty = 0
-    max_consecutive_empty = 3  # Stop after 3 consecutive empty pages
+    connector = aiohttp.TCPConnector(limit=max_workers, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        semaphore = asyncio.Semaphore(max_workers)
 
-    while True:
-        # Check end condition
-        if end_page and current_page > end_page:
-            print(f"Reached end page {end_page}")
-            break
+        current_page = start_page
+        consecutive_empty = 0
+        max_consecutive_empty = 3  # Stop after 3 consecutive empty pages
 
-        # Skip if already scraped
-        if use_cache and current_page in completed_pages:
-            print(f"Skipping page {current_page} (already scraped)")
-            current_page += 1
-            continue
+        while True:
+            # Check end condition
+            if end_page and current_page > end_page:
+                print(f"Reached end page {end_page}")
+                break
 
-        try:
-            # Fetch articles from API
-            articles = fetch_articles_from_api(
-                page_number=current_page, count=articles_per_page
-            )
+            # Skip if already scraped
+            if use_cache and current_page in completed_pages:
+                print(f"Skipping page {current_page} (already scraped)")
+                current_page += 1
+                continue
 
-            # Check for end of pagination or API error
-            if articles is None:
-                print(f"API error on page {current_page}, retrying...")
-                time.sleep(5)
-                articles = fetch_articles_from_api(
-                    page_number=current_page, count=articles_per_page
+            try:
+                # Fetch articles from API
+                articles = await fetch_articles_from_api(
+                    session, page_number=current_page, count=articles_per_page
                 )
+
+                # Check for end of pagination or API error
                 if articles is None:
-                    print(f"API still failing, skipping page {current_page}")
+                    print(f"API error on page {current_page}, retrying...")
+                    await asyncio.sleep(5)
+                    articles = await fetch_articles_from_api(
+                        session, page_number=current_page, count=articles_per_page
+                    )
+                    if articles is None:
+                        print(f"API still failing, skipping page {current_page}")
+                        current_page += 1
+                        continue
+
+                if not articles:
+                    consecutive_empty += 1
+                    if consecutive_empty >= max_consecutive_empty:
+                        print(
+                            f"Stopping after {max_consecutive_empty} consecutive empty pages"
+                        )
+                        break
                     current_page += 1
                     continue
 
-            if not articles:
-                consecutive_empty += 1
-                if consecutive_empty >= max_consecutive_empty:
-                    print(
-                        f"Stopping after {max_consecutive_empty} consecutive empty pages"
-                    )
-                    break
-                current_page += 1
-                continue
+                consecutive_empty = 0
+                stats["total_urls_found"] += len(articles)
 
-            consecutive_empty = 0
-            stats["total_urls_found"] += len(articles)
-
-            # Batch check for existing URLs
-            print(f"  Checking for duplicates...")
-            all_urls = [article["Article Link"] for article in articles]
-            existing_urls = batch_check_existing_urls(collection, all_urls)
+                # Batch check for existing URLs
+                print(f"  Checking for duplicates...")
+                all_urls = [article["Article Link"] for article in articles]
+                existing_urls = batch_check_existing_urls(
+                    collection, all_urls, known_urls
+                )
 
-            # Filter out articles that already exist
-            new_articles = [
-                article
-                for article in articles
-                if article["Article Link"] not in existing_urls
-            ]
+                # Filter out articles that already exist
+                new_articles = [
+                    article
+                    for article in articles
+                    if article["Article Link"] not in existing_urls
+                ]
 
-            duplicates_found = len(articles) - len(new_articles)
-            if duplicates_found > 0:
-                with stats_lock:
+                duplicates_found = len(articles) - len(new_articles)
+                if duplicates_found > 0:
                     stats["duplicates_skipped"] += duplicates_found
-                print(
-                    f"  Found {duplicates_found} duplicates, processing {len(new_articles)} new articles"
-                )
+                    print(
+                        f"  Found {duplicates_found} duplicates, processing {len(new_articles)} new articles"
+                    )
 
-            if not new_articles:
-                print(
-                    f"  All articles on page {current_page} already exist in database"
-                )
-                if use_cache:
-                    completed_pages.add(current_page)
-                    save_progress(
-                        list(completed_pages), current_page, stats["new_articles_added"]
+                if not new_articles:
+                    print(
+                        f"  All articles on page {current_page} already exist in database"
                     )
-                current_page += 1
-                continue
+                    if use_cache:
+                        completed_pages.add(current_page)
+                        save_progress(
+                            list(completed_pages),
+                            current_page,
+                            stats["new_articles_added"],
+                        )
+                    current_page += 1
+                    continue
 
-            # Process articles in parallel
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_article = {
-                    executor.submit(
-                        process_single_article,
-                        article_info,
-                        collection,
-                        stats_lock,
-                        stats,
-                    ): article_info
+                # Process articles concurrently
+                tasks = [
+                    process_single_article(session, semaphore, article_info, stats)
                     for article_info in new_articles
-                }
+                ]
 
-                for future in as_completed(future_to_article):
+                documents = []
+                for task in asyncio.as_completed(tasks):
                     try:
-                        success, message = future.result()
+                        document, message = await task
                         print(message)
-                        time.sleep(random.uniform(0.5, 1.5))
+                        if document is not None:
+                            documents.append(document)
                     except Exception as e:
                         print(f"    ✗ Task exception: {str(e)}")
-                        with stats_lock:
-                            stats["extraction_failures"] += 1
-
-            # Mark page as completed
-            if use_cache:
-                completed_pages.add(current_page)
-                save_progress(
-                    list(completed_pages), current_page, stats["new_articles_added"]
-                )
+                        stats["extraction_failures"] += 1
 
-            print(
-                f"  Page {current_page} completed - Total added: {stats['new_articles_added']}"
-            )
+                # Insert the page's articles into MongoDB in one round trip
+                if documents:
+                    try:
+                        inserted, duplicates, errors = insert_articles(
+                            collection, documents
+                        )
+                    except Exception as e:
+                        print(f"  ✗ MongoDB insert error: {str(e)}")
+                        inserted, duplicates, errors = 0, 0, len(documents)
+                    if not errors:
+                        # Every URL of the page is now stored
+                        known_urls.update(doc["url"] for doc in documents)
+                    stats["new_articles_added"] += inserted
+                    stats["duplicates_skipped"] += duplicates
+                    stats["extraction_failures"] += errors
+                    print(
+                        f"  Inserted {inserted} articles, {duplicates} duplicates, {errors} errors"
+                    )
 
-        except Exception as e:
-            print(f"Error on page {current_page}: {e}")
+                # Mark page as completed
+                if use_cache:
+                    completed_pages.add(current_page)
+                    save_progress(
+                        list(completed_pages), current_page, stats["new_articles_added"]
+                    )
 
-        current_page += 1
-        time.sleep(random.uniform(1, 2))
+                print(
+                    f"  Page {current_page} completed - Total added: {stats['new_articles_added']}"
+                )
+
+            except Exception as e:
+                print(f"Error on page {current_page}: {e}")
+
+            current_page += 1
 
     return stats
 
@@ -800,12 +984,14 @@ def main():
     print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
 
     # Scrape articles
-    stats = scrape_jagran_articles(
-        start_page=START_PAGE,
-        end_page=END_PAGE,
-        articles_per_page=ARTICLES_PER_PAGE,
-        use_cache=True,
-        max_workers=MAX_WORKERS,
+    stats = asyncio.run(
+        scrape_jagran_articles(
+            start_page=START_PAGE,
+            end_page=END_PAGE,
+            articles_per_page=ARTICLES_PER_PAGE,
+            use_cache=True,
+            max_workers=MAX_WORKERS,
+        )
     )
 
     # Display results